@@ -6,11 +6,32 @@ This script executes all implemented daily solutions and displays
 their results in a formatted table.
 """
 
+import os
 import sys
+import json
 import time
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from importlib import import_module
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from utils import tracing
+from utils import cache
+from utils.cache import CACHE_DIR, cache_file, source_dependencies, sources_digest
+from utils.profiling import DEFAULT_TOP, PhaseProfiler, add_profiling_arguments, format_bytes
+from utils.tracing import span
+
 
 # Problem descriptions for each day
 DESCRIPTIONS = {
@@ -26,9 +47,102 @@ DESCRIPTIONS = {
     10: "Factory - Lights Out & Joltage",
 }
 
+# Phases timed separately in benchmark mode
+PHASES = ('parse', 'part1', 'part2')
+
+# Default location of the benchmark JSON report
+BENCH_REPORT = Path('benchmark.json')
+
+# Named benchmark baselines (host specific, not tracked in git)
+BASELINE_DIR = Path('benchmarks')
+
+# Serialized parse_input results (opt-in with --parse-cache)
+PARSED_CACHE_DIR = CACHE_DIR / "parsed"
+
+# Seconds between checks on an isolated day's child process
+POLL_INTERVAL = 0.01
+
+# ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+# Answers and timings of previous runs, keyed by input and source hashes
+RESULT_CACHE = CACHE_DIR / "run_all_results.json"
+
+# Default relative slowdown of a phase's fastest run that counts as a regression
+REGRESSION_THRESHOLD = 0.10
+
+# Phases whose fastest run moves by less than this are treated as noise
+REGRESSION_MIN_NS = 500_000
+
+
+def parsed_path(day: int):
+    """Return the parsed-input cache file for a day's current input and source.
+
+    Entries for older inputs or sources of the same day are removed.
+
+    Returns:
+        Path, or None if the day has no module or input yet
+    """
+    key = result_key(day)
+    if key is None:
+        return None
+    path = cache_file(PARSED_CACHE_DIR, f"day_{day:02d}_{key[:16]}.bin")
+    for stale in PARSED_CACHE_DIR.glob(f"day_{day:02d}_*.bin"):
+        if stale != path:
+            stale.unlink()
+    return path
+
+
+def parse_day(module, raw_input, path=None):
+    """Parse a day's input, reusing the parsed-input cache at path if given.
 
-def run_day(day: int):
-    """Run a single day's solution and return results."""
+    A day module may define dump_parsed(data, path) and load_parsed(path) to
+    store its parsed structure in its own format; otherwise the pickle
+    protocol 5 helpers from utils.cache are used.
+    """
+    if path is None:
+        return module.parse_input(raw_input)
+
+    load = getattr(module, 'load_parsed', cache.load_parsed)
+    if path.exists():
+        return load(path)
+
+    data = module.parse_input(raw_input)
+    getattr(module, 'dump_parsed', cache.dump_parsed)(data, path)
+    return data
+
+
+def run_day(day: int, profile=False, memory=False, top=DEFAULT_TOP, trace=False,
+            parse_cache=False):
+    """Run a single day's solution and return results.
+
+    Args:
+        day: Day number
+        profile: Profile each phase with cProfile
+        memory: Trace each phase's peak memory with tracemalloc
+        top: Functions / allocation sites listed per phase
+        trace: Record timeline spans for a Chrome trace
+        parse_cache: Load the parsed input from the parsed-input cache
+
+    Returns:
+        Dict with the answers ('part1', 'part2'), a 'time' string for the
+        table, the 'elapsed' wall and 'cpu' process seconds (None when the day
+        did not run), the per-phase memory 'peaks' in bytes, the profiling
+        'report' text and the recorded 'trace' events
+    """
+    profiler = PhaseProfiler(f"day_{day:02d}", profile=profile, memory=memory, top=top)
+    if trace:
+        tracing.enable()
+    with span(f"day {day:02d}"):
+        result = solve_day(day, profiler, parse_cache)
+    result['trace'] = tracing.collect() if trace else []
+    return result
+
+
+def solve_day(day: int, profiler, parse_cache=False):
+    """Parse and solve a day with each phase under profiler; see run_day."""
+    result = {'part1': None, 'part2': None, 'elapsed': None, 'cpu': None,
+              'peaks': {}, 'report': ''}
     try:
         # Import the day's module
         module = import_module(f'solutions.day_{day:02d}')
@@ -36,45 +150,552 @@ def run_day(day: int):
         # Read the input
         input_file = Path(f'inputs/day_{day:02d}.txt')
         if not input_file.exists():
-            return None, None, "Input file not found"
+            return dict(result, time="Input file not found")
 
         raw_input = input_file.read_text()
 
         # Parse and solve
-        start_time = time.time()
-        data = module.parse_input(raw_input)
-        part1_result = module.part1(data)
-        part2_result = module.part2(data)
-        elapsed = time.time() - start_time
+        start_time = time.perf_counter()
+        start_cpu = time.process_time()
+        path = parsed_path(day) if parse_cache else None
+        with profiler.phase('parse'), span('parse'):
+            data = parse_day(module, raw_input, path)
+        with profiler.phase('part1'), span('part1'):
+            result['part1'] = module.part1(data)
+        with profiler.phase('part2'), span('part2'):
+            result['part2'] = module.part2(data)
+        result['cpu'] = time.process_time() - start_cpu
+        result['elapsed'] = time.perf_counter() - start_time
 
-        return part1_result, part2_result, f"{elapsed:.3f}s"
+        return dict(result, time=f"{result['elapsed']:.3f}s",
+                    peaks=profiler.peaks, report=profiler.report())
 
     except ImportError:
-        return None, None, "Not implemented"
+        return dict(result, time="Not implemented")
+    except MemoryError:
+        return dict(result, time="OOM")
     except Exception as e:
-        return None, None, f"Error: {str(e)[:30]}"
+        return dict(result, time=f"Error: {str(e)[:30]}")
+
+
+def result_key(day: int):
+    """Hash a day's input file and the source of its module and utils imports.
+
+    Returns:
+        Hex digest, or None if the day has no module or input yet
+    """
+    module_file = Path(f'solutions/day_{day:02d}.py')
+    input_file = Path(f'inputs/day_{day:02d}.txt')
+    if not module_file.exists() or not input_file.exists():
+        return None
+    return sources_digest([input_file, *source_dependencies(module_file)])
+
+
+def load_result_cache(path=RESULT_CACHE):
+    """Load cached day results, or an empty store if there is none."""
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_result_cache(store, path=RESULT_CACHE):
+    """Write cached day results."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(store, indent=2, default=str) + "\n")
 
 
-def main():
+def cached_results(days, keys, store, refresh=()):
+    """Return run_day-style results for days whose cache entry matches its key."""
+    results = {}
+    for day in days:
+        entry = store.get(str(day))
+        if day in refresh or keys[day] is None or entry is None or entry['key'] != keys[day]:
+            continue
+        results[day] = {
+            'part1': entry['part1'], 'part2': entry['part2'],
+            'elapsed': entry['elapsed'], 'cpu': entry['cpu'],
+            'time': f"{entry['elapsed']:.3f}s*",
+            'peaks': {}, 'report': '', 'trace': [], 'cached': True,
+        }
+    return results
+
+
+def limit_memory(limit_bytes):
+    """Cap this process's address space with RLIMIT_AS."""
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit_bytes = min(limit_bytes, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, hard))
+
+
+def wait_child(proc, timeout=None):
+    """Wait for a child process, killing it after timeout seconds.
+
+    Returns:
+        Tuple (timed_out, peak RSS in bytes or None)
+    """
+    if not hasattr(os, 'wait4'):
+        try:
+            proc.wait(timeout)
+            return False, None
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            return True, None
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    timed_out = False
+    while True:
+        pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+        if pid:
+            break
+        if deadline is not None and time.monotonic() > deadline:
+            proc.kill()
+            _, status, usage = os.wait4(proc.pid, 0)
+            timed_out = True
+            break
+        time.sleep(POLL_INTERVAL)
+
+    # The child is reaped, so record its status for Popen
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return timed_out, usage.ru_maxrss * RSS_UNIT
+
+
+def run_day_isolated(day: int, timeout=None, memory_limit=None, profile=False, memory=False,
+                     top=DEFAULT_TOP, trace=False, parse_cache=False):
+    """Run a day in a child process with a wall-clock timeout and memory cap.
+
+    The child is this script in --child mode; it limits its own address space
+    with RLIMIT_AS before importing the solution and writes run_day's result
+    as JSON. A crash, timeout or memory exhaustion only affects this day.
+
+    Args:
+        day: Day number
+        timeout: Seconds before the child is killed (None waits forever)
+        memory_limit: Address-space limit in bytes (None for no limit)
+        profile, memory, top, trace, parse_cache: As for run_day
+
+    Returns:
+        run_day's result, plus the child's peak 'rss' in bytes (None if the
+        platform does not report it); 'time' is "TIMEOUT" or "OOM" on breach
+    """
+    result = {'part1': None, 'part2': None, 'elapsed': None, 'cpu': None,
+              'peaks': {}, 'report': '', 'trace': []}
+
+    command = [sys.executable, str(Path(__file__).resolve()), '--child', str(day)]
+    if memory_limit is not None:
+        command += ['--memory-limit', str(memory_limit // 2**20)]
+    command += ['--top', str(top)]
+    if profile:
+        command.append('--profile')
+    if memory:
+        command.append('--memory')
+    if trace:
+        # The child only returns its events; the parent writes the trace
+        command += ['--trace', os.devnull]
+    if parse_cache:
+        command.append('--parse-cache')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "result.json"
+        errors = Path(tmp) / "stderr.txt"
+        with open(errors, 'w') as stderr:
+            proc = subprocess.Popen(command + ['--child-output', str(output)],
+                                    stdout=subprocess.DEVNULL, stderr=stderr)
+            timed_out, rss = wait_child(proc, timeout)
+
+        if timed_out:
+            return dict(result, time="TIMEOUT", rss=rss)
+        if output.exists():
+            return dict(json.loads(output.read_text()), rss=rss)
+
+        # The child died without reporting: killed for memory or crashed
+        if memory_limit is not None and proc.returncode == -9:
+            return dict(result, time="OOM", rss=rss)
+        lines = errors.read_text().strip().splitlines()
+        message = lines[-1] if lines else f"exit status {proc.returncode}"
+        return dict(result, time=f"Error: {message[:30]}", rss=rss)
+
+
+def run_child(args):
+    """Entry point of an isolated day's child process (see run_day_isolated)."""
+    if args.memory_limit is not None:
+        limit_memory(args.memory_limit * 2**20)
+    result = run_day(args.child, profile=args.profile, memory=args.memory, top=args.top,
+                     trace=args.trace is not None, parse_cache=args.parse_cache)
+    args.child_output.write_text(json.dumps(result, default=str))
+
+
+def timed_ns(func, *args):
+    """Call func(*args) and return (value, elapsed nanoseconds)."""
+    start = time.perf_counter_ns()
+    value = func(*args)
+    return value, time.perf_counter_ns() - start
+
+
+def summarize(samples):
+    """Summarize a list of nanosecond timings.
+
+    Returns:
+        Dict with min, median and (sample) standard deviation in nanoseconds,
+        and the raw samples
+    """
+    return {
+        'min_ns': min(samples),
+        'median_ns': statistics.median(samples),
+        'stdev_ns': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'samples': samples,
+    }
+
+
+def benchmark_day(day: int, warmup: int = 1, repeat: int = 5, parse_cache=False):
+    """Benchmark a day's parse, part1 and part2 phases separately.
+
+    Each iteration parses the raw input afresh and solves both parts on it, so
+    every phase sees the same state as a normal run. The first ``warmup``
+    iterations are discarded. With ``parse_cache`` each iteration also times a
+    warm 'load' of the parsed-input cache after the cold parse, and solves the
+    parts on the loaded data.
+
+    Args:
+        day: Day number
+        warmup: Number of untimed iterations
+        repeat: Number of timed iterations
+        parse_cache: Also time loading the parsed-input cache
+
+    Returns:
+        Dict like run_day's, plus 'phases' mapping each phase to its summary
+        (None when the day did not run)
+    """
+    result = {'part1': None, 'part2': None, 'elapsed': None, 'cpu': None, 'phases': None}
+    try:
+        module = import_module(f'solutions.day_{day:02d}')
+
+        input_file = Path(f'inputs/day_{day:02d}.txt')
+        if not input_file.exists():
+            return dict(result, time="Input file not found")
+
+        raw_input = input_file.read_text()
+
+        path = parsed_path(day) if parse_cache else None
+        phases = ('parse', 'load', 'part1', 'part2') if path is not None else PHASES
+        samples = {phase: [] for phase in phases}
+        for iteration in range(warmup + max(1, repeat)):
+            timings = {}
+            data, timings['parse'] = timed_ns(module.parse_input, raw_input)
+            if path is not None:
+                if not path.exists():
+                    getattr(module, 'dump_parsed', cache.dump_parsed)(data, path)
+                load = getattr(module, 'load_parsed', cache.load_parsed)
+                data, timings['load'] = timed_ns(load, path)
+            result['part1'], timings['part1'] = timed_ns(module.part1, data)
+            result['part2'], timings['part2'] = timed_ns(module.part2, data)
+            if iteration >= warmup:
+                for phase in phases:
+                    samples[phase].append(timings[phase])
+
+        result['phases'] = {phase: summarize(samples[phase]) for phase in phases}
+        result['elapsed'] = sum(result['phases'][phase]['median_ns'] for phase in PHASES) / 1e9
+        return dict(result, time=f"{result['elapsed']:.3f}s")
+
+    except ImportError:
+        return dict(result, time="Not implemented")
+    except MemoryError:
+        return dict(result, time="OOM")
+    except Exception as e:
+        return dict(result, time=f"Error: {str(e)[:30]}")
+
+
+def run_days(days, jobs=None, task=run_day):
+    """Run task(day) for the given days, in worker processes when jobs > 1.
+
+    Returns:
+        Dict mapping day to its result
+    """
+    if jobs is None or jobs <= 1:
+        return {day: task(day) for day in days}
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(task, day): day for day in days}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Run all Advent of Code 2025 solutions.")
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='run days in N worker processes')
+    parser.add_argument('--bench', action='store_true',
+                        help='benchmark parse, part1 and part2 separately')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='untimed iterations per day in benchmark mode (default: 1)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='timed iterations per day in benchmark mode (default: 5)')
+    parser.add_argument('--json', type=Path, default=BENCH_REPORT, metavar='PATH',
+                        help=f'benchmark report path (default: {BENCH_REPORT})')
+    parser.add_argument('--save-baseline', metavar='NAME',
+                        help=f'benchmark and save the results as {BASELINE_DIR}/NAME.json')
+    parser.add_argument('--compare', metavar='NAME',
+                        help='benchmark and fail if any phase regressed against baseline NAME')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='allowed relative slowdown of a phase minimum '
+                             f'(default: {REGRESSION_THRESHOLD})')
+    add_profiling_arguments(parser)
+    parser.add_argument('--trace', type=Path, metavar='PATH',
+                        help='write a Chrome trace-event JSON timeline of all phases')
+    parser.add_argument('--parse-cache', action='store_true',
+                        help='reuse serialized parse_input results; benchmarks '
+                             'then time the cold parse and the warm load separately')
+    parser.add_argument('--isolate', action='store_true',
+                        help='run each day in its own child process')
+    parser.add_argument('--timeout', type=float, default=None, metavar='SECONDS',
+                        help='kill an isolated day after this many seconds (implies --isolate)')
+    parser.add_argument('--memory-limit', type=int, default=None, metavar='MB',
+                        help='address-space limit of an isolated day (implies --isolate)')
+    parser.add_argument('--child', type=int, metavar='DAY', help=argparse.SUPPRESS)
+    parser.add_argument('--child-output', type=Path, help=argparse.SUPPRESS)
+    parser.add_argument('--no-cache', action='store_true',
+                        help='recompute every day instead of reusing cached results')
+    parser.add_argument('--refresh', type=int, action='append', default=[], metavar='DAY',
+                        help='recompute DAY even if its cached result is current (repeatable)')
+    return parser.parse_args(argv)
+
+
+def format_peaks(peaks):
+    """Format per-phase peak memory as 'parse / part1 / part2'."""
+    if not peaks:
+        return "-"
+    return " / ".join(format_bytes(peaks[phase]) if phase in peaks else "-" for phase in PHASES)
+
+
+def format_ns(ns):
+    """Format a nanosecond duration in milliseconds for the table."""
+    return f"{ns / 1e6:.3f}ms"
+
+
+def print_benchmark(days, results):
+    """Print the per-phase benchmark table."""
+    print(f"{'Day':<5} {'Phase':<8} {'Min':<14} {'Median':<14} {'Stdev':<14} {'Answer':<20}")
+    print("-" * 80)
+
+    for day in days:
+        result = results[day]
+        if result['phases'] is None:
+            print(f"{day:<5} {'-':<8} {result['time']}")
+            continue
+
+        for phase, stats in result['phases'].items():
+            answer = str(result.get(phase, ''))[:20]
+            print(f"{day:<5} {phase:<8} {format_ns(stats['min_ns']):<14} "
+                  f"{format_ns(stats['median_ns']):<14} {format_ns(stats['stdev_ns']):<14} "
+                  f"{answer:<20}")
+
+
+def environment_metadata():
+    """Describe the interpreter and host a benchmark ran on."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'executable': sys.executable,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'host': platform.node(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def write_report(path, days, results, args):
+    """Write benchmark results, with environment metadata, as JSON.
+
+    Args:
+        path: Output file
+        days: Days included in the run
+        results: Dict mapping day to its benchmark_day result
+        args: Parsed command-line options
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment_metadata(),
+        'warmup': args.warmup,
+        'repeat': args.repeat,
+        'days': {
+            str(day): {
+                'status': results[day]['time'],
+                'part1': results[day]['part1'],
+                'part2': results[day]['part2'],
+                'phases': results[day]['phases'],
+            }
+            for day in days
+        },
+    }
+    path.write_text(json.dumps(report, indent=2, default=str) + "\n")
+
+
+def baseline_path(name):
+    """Return the file storing the named baseline."""
+    return BASELINE_DIR / f"{name}.json"
+
+
+def compare_to_baseline(baseline, days, results, threshold=REGRESSION_THRESHOLD):
+    """Compare benchmark results against a stored baseline and print the deltas.
+
+    A phase regresses when its fastest run is more than ``threshold`` (a fraction)
+    slower than the baseline's and the slowdown exceeds REGRESSION_MIN_NS. A
+    baseline phase with no current timing (the day failed, or the phase is gone)
+    also counts as a regression.
+
+    Args:
+        baseline: Baseline report loaded from JSON
+        days: Days included in the run
+        results: Dict mapping day to its benchmark_day result
+        threshold: Allowed relative slowdown
+
+    Returns:
+        List of (day, phase) pairs that regressed or are missing
+    """
+    environment = environment_metadata()
+    for key in ('python', 'implementation', 'host'):
+        stored = baseline.get('environment', {}).get(key)
+        if stored != environment[key]:
+            print(f"Warning: baseline {key} is {stored}, current is {environment[key]}")
+
+    print(f"{'Day':<5} {'Phase':<8} {'Baseline':<14} {'Current':<14} {'Change':<10} {'Status':<10}")
+    print("-" * 80)
+
+    regressions = []
+    for day in days:
+        before = baseline['days'].get(str(day), {}).get('phases')
+        if before is None:
+            continue
+        after = results[day]['phases'] or {}
+
+        for phase in before:
+            old = before[phase]['min_ns']
+            if phase not in after:
+                regressions.append((day, phase))
+                print(f"{day:<5} {phase:<8} {format_ns(old):<14} {'-':<14} {'':<10} "
+                      f"MISSING ({results[day]['time']})")
+                continue
+
+            new = after[phase]['min_ns']
+            change = (new - old) / old if old else 0.0
+            status = "ok"
+            if change > threshold and new - old > REGRESSION_MIN_NS:
+                status = "REGRESSED"
+                regressions.append((day, phase))
+            elif change < -threshold and old - new > REGRESSION_MIN_NS:
+                status = "faster"
+            print(f"{day:<5} {phase:<8} {format_ns(old):<14} {format_ns(new):<14} "
+                  f"{change:<+10.1%} {status:<10}")
+
+    return regressions
+
+
+def main(argv=None):
     """Run all solutions and display results."""
+    args = parse_args(argv)
+    if args.child is not None:
+        run_child(args)
+        return
+    if args.save_baseline or args.compare:
+        args.bench = True
+    if args.timeout is not None or args.memory_limit is not None:
+        args.isolate = True
+
+    baseline = None
+    if args.compare:
+        path = baseline_path(args.compare)
+        if not path.exists():
+            sys.exit(f"Baseline not found: {path}")
+        baseline = json.loads(path.read_text())
+
     print("=" * 80)
     print("Advent of Code 2025 - All Solutions".center(80))
     print("=" * 80)
     print()
 
-    # Table header
-    print(f"{'Day':<5} {'Description':<35} {'Part 1':<15} {'Part 2':<15} {'Time':<10}")
-    print("-" * 80)
+    # Run each day
+    days = [day for day in range(1, 26) if day in DESCRIPTIONS]
+    wall_start = time.perf_counter()
+    if args.bench:
+        task = partial(benchmark_day, warmup=args.warmup, repeat=args.repeat,
+                       parse_cache=args.parse_cache)
+        results = run_days(days, args.jobs, task)
+    else:
+        # Profiling and tracing need real runs, so they bypass the result cache
+        use_cache = not (args.no_cache or args.profile or args.memory or args.trace)
+        keys, store, results = {}, {}, {}
+        if use_cache:
+            keys = {day: result_key(day) for day in days}
+            store = load_result_cache()
+            results = cached_results(days, keys, store, args.refresh)
+
+        task = partial(run_day, profile=args.profile, memory=args.memory, top=args.top,
+                       trace=args.trace is not None, parse_cache=args.parse_cache)
+        if args.isolate:
+            memory_limit = None if args.memory_limit is None else args.memory_limit * 2**20
+            task = partial(run_day_isolated, timeout=args.timeout, memory_limit=memory_limit,
+                           profile=args.profile, memory=args.memory, top=args.top,
+                           trace=args.trace is not None, parse_cache=args.parse_cache)
+        fresh = run_days([day for day in days if day not in results], args.jobs, task)
+        results.update(fresh)
+
+        if use_cache:
+            for day, result in fresh.items():
+                if result['elapsed'] is not None and keys[day] is not None:
+                    store[str(day)] = {'key': keys[day], 'part1': result['part1'],
+                                       'part2': result['part2'], 'elapsed': result['elapsed'],
+                                       'cpu': result['cpu']}
+            save_result_cache(store)
+    wall_time = time.perf_counter() - wall_start
+
+    if args.bench:
+        print_benchmark(days, results)
+        write_report(args.json, days, results, args)
+        print("-" * 80)
+        print(f"\nBenchmark report written to {args.json}")
+        if args.save_baseline:
+            write_report(baseline_path(args.save_baseline), days, results, args)
+            print(f"Baseline saved to {baseline_path(args.save_baseline)}")
+        print(f"Wall Time: {wall_time:.3f}s")
+        print()
+
+        if baseline is not None:
+            regressions = compare_to_baseline(baseline, days, results, args.threshold)
+            print("-" * 80)
+            if regressions:
+                phases = ", ".join(f"day {day} {phase}" for day, phase in regressions)
+                print(f"\nRegressed beyond {args.threshold:.0%} or missing: {phases}")
+                sys.exit(1)
+            print(f"\nNo phase regressed beyond {args.threshold:.0%} of baseline {args.compare}")
+        return
+
+    # Table header (with per-phase peak memory and child RSS columns when measured)
+    width = 80 + 36 * args.memory + 11 * args.isolate
+    header = f"{'Day':<5} {'Description':<35} {'Part 1':<15} {'Part 2':<15} {'Time':<10}"
+    if args.memory:
+        header += f" {'Peak memory (parse / p1 / p2)':<35}"
+    if args.isolate:
+        header += f" {'Peak RSS':<10}"
+    print(header)
+    print("-" * width)
 
     total_stars = 0
     total_time = 0.0
+    total_cpu = 0.0
 
-    # Run each day
-    for day in range(1, 26):
-        if day not in DESCRIPTIONS:
-            continue
-
-        part1, part2, time_str = run_day(day)
+    for day in days:
+        result = results[day]
+        part1, part2 = result['part1'], result['part2']
 
         # Count stars
         if part1 is not None:
@@ -92,21 +713,43 @@ def main():
         if len(p2_str) > 13:
             p2_str = p2_str[:10] + "..."
 
-        # Extract time if available
-        if time_str.endswith('s'):
-            try:
-                total_time += float(time_str[:-1])
-            except ValueError:
-                pass
+        if result['elapsed'] is not None:
+            total_time += result['elapsed']
+            total_cpu += result['cpu']
 
-        print(f"{day:<5} {DESCRIPTIONS[day]:<35} {p1_str:<15} {p2_str:<15} {time_str:<10}")
+        row = f"{day:<5} {DESCRIPTIONS[day]:<35} {p1_str:<15} {p2_str:<15} {result['time']:<10}"
+        if args.memory:
+            row += f" {format_peaks(result['peaks']):<35}"
+        if args.isolate:
+            rss = result.get('rss')
+            row += f" {format_bytes(rss) if rss is not None else '-':<10}"
+        print(row)
 
     # Summary
-    print("-" * 80)
+    print("-" * width)
     print(f"\nTotal Stars: {total_stars} ⭐")
-    print(f"Total Time: {total_time:.3f}s")
+    print(f"Total Time: {total_time:.3f}s (sum of days, {total_cpu:.3f}s CPU)")
+    print(f"Wall Time: {wall_time:.3f}s" + (f" with {args.jobs} jobs" if args.jobs else ""))
+    if any(result.get('cached') for result in results.values()):
+        print("* cached result (inputs and sources unchanged); use --no-cache or --refresh DAY")
     print()
 
+    if args.trace is not None:
+        events = [event for day in days for event in results[day]['trace']]
+        names = {os.getpid(): "run_all"}
+        if args.isolate or (args.jobs and args.jobs > 1):
+            names = {event['pid']: "worker" if not args.isolate else f"day {day:02d}"
+                     for day in days for event in results[day]['trace']}
+        tracing.write_chrome_trace(args.trace, events, names)
+        print(f"Trace written to {args.trace} (open in chrome://tracing or ui.perfetto.dev)")
+        print()
+
+    # Profiles, in day order
+    for day in days:
+        if results[day]['report']:
+            print(results[day]['report'])
+            print()
+
 
 if __name__ == "__main__":
     main()
@@ -13,6 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils import read_input
+from utils.profiling import PhaseProfiler
 
 
 def parse_input(data: str):
@@ -75,14 +76,21 @@ def part2(rotations):
 def main():
     # Get day number from filename
     day = int(Path(__file__).stem.split('_')[1])
+    profiler = PhaseProfiler.from_command_line(f"day_{day:02d}")
 
     # Read and parse input
     raw_input = read_input(day)
-    data = parse_input(raw_input)
+    with profiler.phase('parse'):
+        data = parse_input(raw_input)
 
     # Solve and print results
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    with profiler.phase('part1'):
+        answer1 = part1(data)
+    print(f"Part 1: {answer1}")
+    with profiler.phase('part2'):
+        answer2 = part2(data)
+    print(f"Part 2: {answer2}")
+    profiler.print_report()
 
 
 if __name__ == "__main__":
@@ -6,149 +6,415 @@ Connect junction boxes using Union-Find to track circuits.
 """
 
 import sys
+import argparse
 from pathlib import Path
 import math
-from collections import Counter
+import heapq
+from collections import defaultdict, namedtuple
+
+import numpy as np
 
 # Add parent directory to path to import utils
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils import read_input
-
-
-class UnionFind:
-    """Union-Find (Disjoint Set Union) data structure."""
-
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-
-    def find(self, x):
-        """Find the root of x with path compression."""
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, x, y):
-        """Union the sets containing x and y."""
-        root_x = self.find(x)
-        root_y = self.find(y)
-
-        if root_x == root_y:
-            return False  # Already in the same set
-
-        # Union by rank
-        if self.rank[root_x] < self.rank[root_y]:
-            self.parent[root_x] = root_y
-        elif self.rank[root_x] > self.rank[root_y]:
-            self.parent[root_y] = root_x
-        else:
-            self.parent[root_y] = root_x
-            self.rank[root_x] += 1
-
-        return True  # Successfully merged
-
-    def get_component_sizes(self):
-        """Get the sizes of all connected components."""
-        components = Counter()
-        for i in range(len(self.parent)):
-            root = self.find(i)
-            components[root] += 1
-        return list(components.values())
-
-
-def parse_input(data: str):
-    """Parse the input data into 3D coordinates."""
+from utils.algorithms import UnionFind
+from utils.cache import (CACHE_DIR, cache_file, input_digest, source_dependencies,
+                         sources_digest)
+from utils.tracing import span
+from utils.profiling import PhaseProfiler, add_profiling_arguments
+
+
+# Pairs sorted by squared distance, stored as parallel arrays
+Edges = namedtuple('Edges', ['dist', 'left', 'right'])
+
+
+def make_edges(dist, left, right):
+    """Build an Edges record with compact array dtypes."""
+    return Edges(
+        np.asarray(dist, dtype=np.int64),
+        np.asarray(left, dtype=np.int32),
+        np.asarray(right, dtype=np.int32),
+    )
+
+
+class JunctionBoxes:
+    """Parsed junction box positions with lazily computed, shared pair data.
+
+    Behaves like the list of positions, and caches the sorted closest-pair
+    edges so part1 and part2 compute them at most once. When ``cache_dir`` is
+    set the edges are also stored on disk, keyed by the input hash and the hash
+    of this solution's sources, so repeated runs load them instead of
+    recomputing and a change to the ranking code never reuses stale edges.
+    """
+
+    def __init__(self, positions, digest=None, cache_dir=None):
+        self.positions = positions
+        self.digest = digest
+        self.cache_dir = cache_dir
+        self._edges = None
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        return self.positions[index]
+
+    def __iter__(self):
+        return iter(self.positions)
+
+    def cached_edges(self):
+        """Return the edges computed so far, or None."""
+        return self._edges
+
+    def edges(self, k, backend='auto', block_size=None):
+        """Return the k closest pairs as sorted Edges, computing them once.
+
+        Args:
+            k: Number of pairs
+            backend: Key of PAIR_BACKENDS, or 'auto' to pick by input size
+            block_size: Rows per block for the NumPy backend, bounding its peak
+                memory; the grid backend is already O(n + k) and ignores it
+        """
+        n = len(self.positions)
+        k = min(k, n * (n - 1) // 2)
+
+        if self._edges is not None and len(self._edges.dist) >= k:
+            return Edges(*(column[:k] for column in self._edges))
+
+        path = None
+        if self.cache_dir is not None and self.digest is not None:
+            source = sources_digest(source_dependencies(__file__))
+            name = f"day_08_{self.digest[:16]}_{source[:16]}_k{k}.npz"
+            path = cache_file(self.cache_dir, name)
+            if path.exists():
+                with np.load(path) as stored:
+                    self._edges = make_edges(stored['dist'], stored['left'], stored['right'])
+                return self._edges
+
+        if backend == 'auto':
+            backend = 'numpy' if n <= NUMPY_BACKEND_MAX_POINTS else 'grid'
+        options = {}
+        if backend == 'numpy' and block_size is not None:
+            options['block_size'] = block_size
+        self._edges = PAIR_BACKENDS[backend](self.positions, k, **options)
+
+        if path is not None:
+            np.savez(path, **self._edges._asdict())
+        return self._edges
+
+
+def parse_input(data: str, cache_dir=None):
+    """Parse the input data into 3D coordinates.
+
+    Args:
+        data: The raw input text
+        cache_dir: Optional directory for the on-disk edge cache
+
+    Returns:
+        JunctionBoxes wrapping the list of (x, y, z) positions
+    """
     lines = data.strip().split('\n')
     positions = []
     for line in lines:
         x, y, z = map(int, line.split(','))
         positions.append((x, y, z))
-    return positions
+    return JunctionBoxes(positions, digest=input_digest(data), cache_dir=cache_dir)
 
 
-def distance(p1, p2):
-    """Calculate Euclidean distance between two 3D points."""
-    return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2 + (p1[2] - p2[2])**2)
+def squared_distance(p1, p2):
+    """Calculate the squared Euclidean distance between two 3D points."""
+    return (p1[0] - p2[0])**2 + (p1[1] - p2[1])**2 + (p1[2] - p2[2])**2
 
 
-def part1(positions):
-    """Connect the 1000 closest pairs and find product of three largest circuits."""
-    n = len(positions)
+def closest_pairs(positions, k):
+    """Find the k closest pairs of points using a uniform 3D cell grid.
 
-    # Calculate all pairwise distances
-    distances = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = distance(positions[i], positions[j])
-            distances.append((dist, i, j))
+    Points are bucketed into cubic cells of side ``cell``; every pair closer
+    than ``cell`` lies in the same or an adjacent cell, so only those are
+    examined. A bounded max-heap keeps the k best pairs seen so far. If the
+    grid does not yield k pairs within ``cell`` the cell size is doubled and
+    the search repeated, so memory stays O(n + k).
 
-    # Sort by distance
-    distances.sort()
+    Args:
+        positions: List of (x, y, z) integer coordinates
+        k: Number of pairs to return
 
-    # Use Union-Find to track circuits
-    uf = UnionFind(n)
+    Returns:
+        Edges with i < j, sorted by squared distance then index
+    """
+    n = len(positions)
+    k = min(k, n * (n - 1) // 2)
+    if k <= 0:
+        return make_edges([], [], [])
+
+    # Pick an initial cell size so that roughly k pairs fall within it,
+    # assuming points are spread evenly over their bounding box
+    extents = [max(p[axis] for p in positions) - min(p[axis] for p in positions)
+               for axis in range(3)]
+    diagonal = math.isqrt(sum(e * e for e in extents)) + 1
+    volume = max(1, extents[0]) * max(1, extents[1]) * max(1, extents[2])
+    cell = max(1, int((3 * k * volume / (2 * math.pi * n * n)) ** (1 / 3)))
+
+    while True:
+        with span('pairwise distances', cell=cell):
+            limit = cell * cell
+            cells = defaultdict(list)
+            for idx, (x, y, z) in enumerate(positions):
+                cells[(x // cell, y // cell, z // cell)].append(idx)
+
+            # Max-heap of the k best pairs, stored negated so heap[0] is the worst
+            heap = []
+            for (cx, cy, cz), members in cells.items():
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        for dz in (-1, 0, 1):
+                            others = cells.get((cx + dx, cy + dy, cz + dz))
+                            if others is None:
+                                continue
+                            for i in members:
+                                p1 = positions[i]
+                                for j in others:
+                                    if j <= i:
+                                        continue
+                                    dist = squared_distance(p1, positions[j])
+                                    if dist > limit:
+                                        continue
+                                    entry = (-dist, -i, -j)
+                                    if len(heap) < k:
+                                        heapq.heappush(heap, entry)
+                                    elif entry > heap[0]:
+                                        heapq.heapreplace(heap, entry)
+
+        # Every pair within `cell` has been seen, so a full heap is exact
+        if len(heap) == k or cell > diagonal:
+            with span('sort'):
+                best = sorted((-d, -i, -j) for d, i, j in heap)
+            return make_edges(*zip(*best))
+        cell *= 2
+
+
+def _smallest_pairs(dist, left, right, k):
+    """Keep the k smallest (dist, left, right) triples, sorted with ties by index."""
+    if len(dist) > k:
+        # Everything tied with the k-th value survives so ties resolve by index
+        threshold = dist[np.argpartition(dist, k - 1)[k - 1]]
+        keep = dist <= threshold
+        dist, left, right = dist[keep], left[keep], right[keep]
+    order = np.lexsort((right, left, dist))[:k]
+    return dist[order], left[order], right[order]
+
+
+def closest_pairs_numpy(positions, k, block_size=256):
+    """Find the k closest pairs of points with blocked NumPy distance rows.
+
+    Squared integer distances are computed for ``block_size`` rows of the
+    upper triangle at a time, the block's candidates are narrowed with
+    ``np.argpartition`` and merged into the running k best, so peak memory is
+    O(block_size * n + k) whatever the size of n^2.
+
+    Args:
+        positions: List of (x, y, z) integer coordinates
+        k: Number of pairs to return
+        block_size: Number of rows of the distance matrix per block
+
+    Returns:
+        Edges with i < j, sorted by squared distance then index
+    """
+    n = len(positions)
+    k = min(k, n * (n - 1) // 2)
+    if k <= 0:
+        return make_edges([], [], [])
+
+    coords = np.array(positions, dtype=np.int64)
+    best_dist = np.empty(0, dtype=np.int64)
+    best_i = np.empty(0, dtype=np.int64)
+    best_j = np.empty(0, dtype=np.int64)
+
+    for start in range(0, n - 1, block_size):
+        stop = min(n - 1, start + block_size)
+        rows = coords[start:stop]
+        cols = coords[start + 1:]
+        width = len(cols)
+
+        with span('pairwise distances', rows=len(rows)):
+            dist = np.zeros((len(rows), width), dtype=np.int64)
+            for axis in range(3):
+                delta = rows[:, axis, None] - cols[None, :, axis]
+                dist += delta * delta
+
+        # Only the upper triangle (j > i), and only pairs that can still place
+        mask = np.arange(width)[None, :] >= np.arange(len(rows))[:, None]
+        if len(best_dist) == k:
+            mask &= dist <= best_dist[-1]
+        flat = np.flatnonzero(mask)
+        if len(flat) == 0:
+            continue
+
+        with span('sort', candidates=len(flat)):
+            block_dist = dist.ravel()[flat]
+            block_i = start + flat // width
+            block_j = start + 1 + flat % width
+            if len(block_dist) > k:
+                block_dist, block_i, block_j = _smallest_pairs(block_dist, block_i, block_j, k)
+
+            best_dist, best_i, best_j = _smallest_pairs(
+                np.concatenate((best_dist, block_dist)),
+                np.concatenate((best_i, block_i)),
+                np.concatenate((best_j, block_j)),
+                k,
+            )
+
+    return make_edges(best_dist, best_i, best_j)
+
+
+# Pair-ranking backends available to part1
+PAIR_BACKENDS = {
+    'grid': closest_pairs,
+    'numpy': closest_pairs_numpy,
+}
+
+# Inputs up to this size use the NumPy backend when backend='auto'
+NUMPY_BACKEND_MAX_POINTS = 5000
+
+
+def part1(boxes, k=1000, backend='auto', block_size=None):
+    """Connect the k closest pairs and find product of three largest circuits.
+
+    backend and block_size are passed to JunctionBoxes.edges.
+    """
+    if not isinstance(boxes, JunctionBoxes):
+        boxes = JunctionBoxes(boxes)
+    edges = boxes.edges(k, backend, block_size)
 
-    # Connect the 1000 closest pairs
-    for i in range(min(1000, len(distances))):
-        dist, box1, box2 = distances[i]
-        uf.union(box1, box2)
+    # Use Union-Find to track circuits
+    uf = UnionFind(len(boxes))
+    with span('union loop', edges=len(edges.dist)):
+        uf.union_many(edges.left, edges.right)
 
-    # Get sizes of all circuits
-    circuit_sizes = uf.get_component_sizes()
+    # Multiply the sizes of the three largest circuits
+    largest = uf.largest_k(3)
+    return largest[0] * largest[1] * largest[2]
 
-    # Sort to get the three largest
-    circuit_sizes.sort(reverse=True)
 
-    # Multiply the three largest
-    return circuit_sizes[0] * circuit_sizes[1] * circuit_sizes[2]
+def mst_last_edge(positions):
+    """Find the longest edge of the Euclidean minimum spanning tree.
 
+    Dense Prim's algorithm over squared integer distances: each step adds the
+    nearest outside point and relaxes the remaining distances with one
+    vectorized row, giving O(n^2) time and O(n) memory. The longest MST edge is
+    the connection that finally joins every point into one circuit.
 
-def part2(positions):
-    """Connect pairs until all junction boxes are in one circuit."""
-    n = len(positions)
-
-    # Calculate all pairwise distances
-    distances = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = distance(positions[i], positions[j])
-            distances.append((dist, i, j))
+    Edges are compared by the composite key (dist, min(i, j), max(i, j)), the
+    order Kruskal over sorted pairs uses, so ties in distance pick the same
+    tree and the same last edge.
 
-    # Sort by distance
-    distances.sort()
+    Args:
+        positions: List of (x, y, z) integer coordinates
 
-    # Use Union-Find to track circuits
-    uf = UnionFind(n)
-
-    # Keep connecting until all are in one circuit
-    for dist, box1, box2 in distances:
-        # Try to connect these boxes
-        connected = uf.union(box1, box2)
-
-        if connected:
-            # Check if all are now in one circuit
-            component_sizes = uf.get_component_sizes()
-            if len(component_sizes) == 1:
-                # All in one circuit - this was the last connection
-                x1 = positions[box1][0]
-                x2 = positions[box2][0]
-                return x1 * x2
-
-    return None
+    Returns:
+        Tuple (i, j) of point indices for that edge, with i < j, or None if n < 2
+    """
+    n = len(positions)
+    if n < 2:
+        return None
+
+    unreached = np.iinfo(np.int64).max
+    coords = np.array(positions, dtype=np.int64)
+    points = np.arange(n)
+    in_tree = np.zeros(n, dtype=bool)
+
+    # Best known edge (dist, lo, hi) joining each outside point to the tree
+    best = np.full(n, unreached, dtype=np.int64)
+    best_lo = np.full(n, n, dtype=np.int64)
+    best_hi = np.full(n, n, dtype=np.int64)
+
+    longest = (-1, 0, 0)
+    current = 0
+    in_tree[0] = True
+    for _ in range(n - 1):
+        diff = coords - coords[current]
+        dist = np.einsum('ij,ij->i', diff, diff)
+
+        # Relax edges of points still outside the tree; equal distances fall
+        # back to comparing the index part of the key
+        outside = ~in_tree
+        closer = (dist < best) & outside
+        ties = np.flatnonzero((dist == best) & outside)
+        if len(ties):
+            lo = np.minimum(ties, current)
+            hi = np.maximum(ties, current)
+            smaller = (lo < best_lo[ties]) | ((lo == best_lo[ties]) & (hi < best_hi[ties]))
+            closer[ties[smaller]] = True
+        best[closer] = dist[closer]
+        best_lo[closer] = np.minimum(points[closer], current)
+        best_hi[closer] = np.maximum(points[closer], current)
+
+        # Pick the outside point whose edge has the smallest key
+        best[in_tree] = unreached
+        nearest = np.flatnonzero(best == best.min())
+        if len(nearest) > 1:
+            nearest = nearest[np.lexsort((best_hi[nearest], best_lo[nearest]))]
+        current = int(nearest[0])
+        in_tree[current] = True
+
+        edge = (int(best[current]), int(best_lo[current]), int(best_hi[current]))
+        if edge > longest:
+            longest = edge
+
+    return longest[1], longest[2]
+
+
+def part2(boxes):
+    """Connect pairs until all junction boxes are in one circuit."""
+    if not isinstance(boxes, JunctionBoxes):
+        boxes = JunctionBoxes(boxes)
+
+    # Kruskal over edges part1 already sorted is exact if they span all boxes
+    edge = None
+    edges = boxes.cached_edges()
+    if edges is not None:
+        uf = UnionFind(len(boxes))
+        with span('union loop', edges=len(edges.dist)):
+            for box1, box2 in zip(edges.left.tolist(), edges.right.tolist()):
+                if uf.union(box1, box2) and uf.num_components == 1:
+                    edge = (box1, box2)
+                    break
+
+    if edge is None:
+        with span('prim'):
+            edge = mst_last_edge(boxes.positions)
+    if edge is None:
+        return None
+
+    box1, box2 = edge
+    return boxes[box1][0] * boxes[box2][0]
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Advent of Code 2025 - Day 8: Playground")
+    parser.add_argument('--cache', action='store_true',
+                        help='keep the sorted edges on disk between runs of the same source')
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+
     # Get day number from filename
     day = int(Path(__file__).stem.split('_')[1])
+    profiler = PhaseProfiler.from_args(f"day_{day:02d}", args)
 
     # Read and parse input
     raw_input = read_input(day)
-    data = parse_input(raw_input)
+    with profiler.phase('parse'):
+        data = parse_input(raw_input, cache_dir=CACHE_DIR if args.cache else None)
 
     # Solve and print results
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    with profiler.phase('part1'):
+        answer1 = part1(data)
+    print(f"Part 1: {answer1}")
+    with profiler.phase('part2'):
+        answer2 = part2(data)
+    print(f"Part 2: {answer2}")
+    profiler.print_report()
 
 
 if __name__ == "__main__":
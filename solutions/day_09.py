@@ -5,13 +5,22 @@ Advent of Code 2025 - Day 9: Movie Theater
 Find the largest rectangle using red tiles as opposite corners.
 """
 
+import os
 import sys
+import heapq
+import multiprocessing
+from multiprocessing import shared_memory
+from bisect import bisect_right
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to path to import utils
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils import read_input
+from utils.profiling import PhaseProfiler
+from utils.tracing import span
 
 
 def parse_input(data: str):
@@ -24,230 +33,620 @@ def parse_input(data: str):
     return tiles
 
 
-def part1(tiles):
-    """Find the largest rectangle area using two red tiles as opposite corners."""
-    max_area = 0
-
-    # Try all pairs of tiles as opposite corners
-    n = len(tiles)
-    for i in range(n):
-        for j in range(i + 1, n):
-            x1, y1 = tiles[i]
-            x2, y2 = tiles[j]
+def rectangle_area(p1, p2):
+    """Area of the rectangle with opposite corners p1 and p2 (inclusive)."""
+    return (abs(p2[0] - p1[0]) + 1) * (abs(p2[1] - p1[1]) + 1)
 
-            # Calculate rectangle area (inclusive of both corners)
-            # From x1 to x2 inclusive is |x2-x1|+1 tiles
-            # From y1 to y2 inclusive is |y2-y1|+1 tiles
-            width = abs(x2 - x1) + 1
-            height = abs(y2 - y1) + 1
-            area = width * height
 
-            max_area = max(max_area, area)
+def staircase(tiles, sign_x, sign_y):
+    """Find the monotone staircase of extreme tiles towards one corner.
 
-    return max_area
+    With sign_x = sign_y = 1 this is the lower-left staircase: the tiles that
+    no other tile beats in both x and y (smaller x and smaller y). The signs
+    flip an axis to get the other three corners.
 
+    Args:
+        tiles: List of (x, y) coordinates
+        sign_x: 1 to prefer small x, -1 to prefer large x
+        sign_y: 1 to prefer small y, -1 to prefer large y
 
-def is_on_boundary(x, y, tiles):
-    """Check if a point is on the boundary formed by consecutive red tiles."""
-    n = len(tiles)
-    for i in range(n):
-        x1, y1 = tiles[i]
-        x2, y2 = tiles[(i + 1) % n]  # Wrap around
+    Returns:
+        The staircase tiles, ordered along the preferred x direction
+    """
+    return staircase_steps(sorted(tiles, key=lambda p: (sign_x * p[0], sign_y * p[1])), sign_y)
 
-        # Check if (x, y) is on the line segment from (x1, y1) to (x2, y2)
-        if x1 == x2:  # Vertical line
-            if x == x1 and min(y1, y2) <= y <= max(y1, y2):
-                return True
-        elif y1 == y2:  # Horizontal line
-            if y == y1 and min(x1, x2) <= x <= max(x1, x2):
-                return True
 
-    return False
+def staircase_steps(ordered, sign_y):
+    """Keep the tiles of an ordered sequence that improve on every earlier y.
 
+    Args:
+        ordered: Tiles sorted along the preferred x, then the preferred y
+        sign_y: 1 to prefer small y, -1 to prefer large y
 
-def is_inside_polygon(x, y, tiles):
-    """Check if a point is inside the polygon using ray casting algorithm."""
-    n = len(tiles)
-    inside = False
+    Returns:
+        The staircase tiles, in the given order
+    """
+    steps = []
+    best_y = None
+    for x, y in ordered:
+        if best_y is None or sign_y * y < best_y:
+            steps.append((x, y))
+            best_y = sign_y * y
+    return steps
 
-    j = n - 1
-    for i in range(n):
-        xi, yi = tiles[i]
-        xj, yj = tiles[j]
 
-        if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
-            inside = not inside
+def max_dominating_area(lower, upper):
+    """Find the largest rectangle with its lower-left corner in lower and its
+    upper-right corner in upper.
 
-        j = i
+    Both staircases are ordered by increasing x (so decreasing y). As the
+    lower-left corner moves along its staircase the best upper-right partner
+    never moves back, so the area matrix is totally monotone: solving the
+    middle row and recursing on each half with the partner range split at its
+    optimum visits O(h log h) pairs. Pairs where the upper corner is below and
+    left of the lower one score their negated product so they never win.
 
-    return inside
+    Args:
+        lower: Lower-left staircase, increasing x
+        upper: Upper-right staircase, increasing x
 
+    Returns:
+        The largest area (0 if no upper corner dominates a lower one)
+    """
+    best = 0
+    pending = [(0, len(lower) - 1, 0, len(upper) - 1)]
+    while pending:
+        lo, hi, first, last = pending.pop()
+        if lo > hi:
+            continue
 
-def is_green_or_red(x, y, tiles, red_set):
-    """Check if a tile is red or green."""
-    # Check if it's a red tile
-    if (x, y) in red_set:
-        return True
+        mid = (lo + hi) // 2
+        px, py = lower[mid]
+        row_best, row_arg = None, first
+        for j in range(first, last + 1):
+            qx, qy = upper[j]
+            width = qx - px + 1
+            height = qy - py + 1
+            area = width * height if width > 0 or height > 0 else -width * height
+            if row_best is None or area > row_best:
+                row_best, row_arg = area, j
 
-    # Check if it's on the boundary
-    if is_on_boundary(x, y, tiles):
-        return True
+        best = max(best, row_best)
+        pending.append((lo, mid - 1, first, row_arg))
+        pending.append((mid + 1, hi, row_arg, last))
 
-    # Check if it's inside the polygon
-    if is_inside_polygon(x, y, tiles):
-        return True
+    return best
 
-    return False
 
+def part1(tiles):
+    """Find the largest rectangle area using two red tiles as opposite corners.
+
+    Replacing a corner by a tile further out in both directions never shrinks
+    the rectangle, so the best pair joins opposite staircases of extreme tiles:
+    lower-left with upper-right, or upper-left with lower-right (the same
+    search with y mirrored). Each pairing is a monotone search over the
+    staircases, so the whole part is O(n log n); it finishes well before a
+    worker pool would start, so only part2 is sharded.
+    """
+    if len(tiles) < 2:
+        return 0
+
+    # Plain tuple sorts give both staircases of each orientation: ascending
+    # (x, y) order for the lower-left one and its reverse for the upper-right
+    max_area = 1
+    for ordered in (sorted(tiles), sorted((x, -y) for x, y in tiles)):
+        lower = staircase_steps(ordered, 1)
+        upper = staircase_steps(reversed(ordered), -1)[::-1]
+        max_area = max(max_area, max_dominating_area(lower, upper))
 
-def part2(tiles):
-    """Find the largest rectangle using only red and green tiles."""
-    n = len(tiles)
+    return max_area
 
-    # Coordinate compression
-    xs = sorted(list(set(p[0] for p in tiles)))
-    ys = sorted(list(set(p[1] for p in tiles)))
 
-    x_map = {x: i for i, x in enumerate(xs)}
-    y_map = {y: i for i, y in enumerate(ys)}
+def pairs_by_area(tiles):
+    """Yield tile pairs in decreasing order of rectangle area.
 
-    W = len(xs) - 1
-    H = len(ys) - 1
+    A heap holds one entry per tile i for its partners k > i. Each row starts
+    with an upper bound taken from the extreme x and y among its partners
+    (sorted suffix minima and maxima), so no areas are computed up front. When
+    a row's bound reaches the top of the heap its areas are computed and sorted
+    once, and from then on it offers its next unvisited partner. Stopping early
+    therefore leaves most rows untouched.
 
-    # Build grid of elementary rectangles
-    is_inside = [[False] * W for _ in range(H)]
+    Args:
+        tiles: List of (x, y) coordinates
 
-    # Identify vertical edges for sweep line
-    v_edges = []
+    Yields:
+        Tuples (area, i, k) with i < k, largest area first
+    """
+    n = len(tiles)
+    if n < 2:
+        return
+    xs = np.array([p[0] for p in tiles], dtype=np.int64)
+    ys = np.array([p[1] for p in tiles], dtype=np.int64)
+
+    # Extremes of x and y over each row's partners k > i
+    x_min = np.minimum.accumulate(xs[::-1])[::-1][1:]
+    x_max = np.maximum.accumulate(xs[::-1])[::-1][1:]
+    y_min = np.minimum.accumulate(ys[::-1])[::-1][1:]
+    y_max = np.maximum.accumulate(ys[::-1])[::-1][1:]
+    head_x, head_y = xs[:-1], ys[:-1]
+    widths = np.maximum(head_x - x_min, x_max - head_x) + 1
+    heights = np.maximum(head_y - y_min, y_max - head_y) + 1
+    bounds = widths * heights
+
+    # Position -1 marks a row still represented by its bound
+    heap = [(-bound, i, -1) for i, bound in enumerate(bounds.tolist())]
+    heapq.heapify(heap)
+    rows = {}
+
+    while heap:
+        neg_area, i, pos = heapq.heappop(heap)
+        if pos < 0:
+            areas = (np.abs(xs[i + 1:] - xs[i]) + 1) * (np.abs(ys[i + 1:] - ys[i]) + 1)
+            order = np.argsort(-areas, kind='stable')
+            rows[i] = (areas[order].tolist(), (order + i + 1).tolist())
+            heapq.heappush(heap, (-rows[i][0][0], i, 0))
+            continue
+
+        areas, partners = rows[i]
+        yield areas[pos], i, partners[pos]
+
+        if pos + 1 < len(areas):
+            heapq.heappush(heap, (-areas[pos + 1], i, pos + 1))
+        else:
+            del rows[i]
+
+
+def interior_cells(tiles, x_map, y_map, W, H):
+    """Mark which compressed grid cells lie inside the polygon.
+
+    Sweeps upwards through the vertex y-coordinates, the only places where the
+    set of vertical edges crossing a row changes. Each vertical edge toggles
+    its column when the sweep reaches its lower end and again at its upper
+    end, so the active edges of every row come from a cumulative XOR down the
+    columns. A second XOR pass along each row applies the even-odd rule, which
+    fills the spans between pairs of active edges.
+
+    Args:
+        tiles: List of (x, y) polygon vertices in order
+        x_map: Mapping from x-coordinate to compressed column index
+        y_map: Mapping from y-coordinate to compressed row index
+        W: Number of compressed columns
+        H: Number of compressed rows
+
+    Returns:
+        Boolean array of shape (H, W), True for interior cells
+    """
+    n = len(tiles)
+    rows = []
+    cols = []
     for k in range(n):
         p1 = tiles[k]
         p2 = tiles[(k + 1) % n]
 
-        if p1[0] == p2[0]:  # Vertical edge
-            y_min, y_max = min(p1[1], p2[1]), max(p1[1], p2[1])
-            v_edges.append((p1[0], y_min, y_max))
+        if p1[0] == p2[0] and p1[1] != p2[1]:  # Vertical edge
+            col = x_map[p1[0]]
+            rows += [y_map[p1[1]], y_map[p2[1]]]
+            cols += [col, col]
+
+    toggles = np.zeros((H + 1, W + 1), dtype=np.uint8)
+    np.bitwise_xor.at(toggles, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1)
+
+    active = np.bitwise_xor.accumulate(toggles, axis=0)
+    inside = np.bitwise_xor.accumulate(active, axis=1)
+    return inside[:H, :W].astype(bool)
 
-    v_edges.sort()
 
-    # Sweep line to mark interior cells
-    for j in range(H):
-        y_mid = (ys[j] + ys[j + 1]) / 2.0
+def prefix_table(is_inside):
+    """Build the 2D prefix sum P with P[j][i] = interior cells below row j, left of column i."""
+    H, W = is_inside.shape
+    P = np.zeros((H + 1, W + 1), dtype=np.int64)
+    P[1:, 1:] = is_inside.cumsum(axis=0, dtype=np.int64).cumsum(axis=1)
+    return P
 
-        row_crossings = []
-        for x, edge_ymin, edge_ymax in v_edges:
-            if edge_ymin < y_mid < edge_ymax:
-                row_crossings.append(x)
 
-        row_crossings.sort()
+# Point locations reported by PolygonIndex.locate
+INSIDE = 'inside'
+BOUNDARY = 'boundary'
+OUTSIDE = 'outside'
 
-        # Even-odd rule: regions between pairs are inside
-        for k in range(0, len(row_crossings), 2):
-            if k + 1 < len(row_crossings):
-                x_start = row_crossings[k]
-                x_end = row_crossings[k + 1]
 
-                idx_start = x_map[x_start]
-                idx_end = x_map[x_end]
+class PolygonIndex:
+    """Point-location index for the rectilinear polygon through the red tiles.
 
-                for i in range(idx_start, idx_end):
-                    is_inside[j][i] = True
+    Holds the coordinate-compressed interior grid with its prefix sums, and the
+    horizontal and vertical edges in hash maps keyed by their fixed coordinate.
+    Locating a point is a dict lookup plus a few binary searches, O(log n).
+    """
 
-    # Build 2D prefix sum
-    P = [[0] * (W + 1) for _ in range(H + 1)]
-    for j in range(H):
-        for i in range(W):
-            val = 1 if is_inside[j][i] else 0
-            P[j + 1][i + 1] = P[j][i + 1] + P[j + 1][i] - P[j][i] + val
+    def __init__(self, tiles):
+        self.tiles = tiles
+        n = len(tiles)
 
-    def count_valid_cells(ix1, iy1, ix2, iy2):
+        # Coordinate compression
+        self.xs = sorted(set(p[0] for p in tiles))
+        self.ys = sorted(set(p[1] for p in tiles))
+
+        self.x_map = {x: i for i, x in enumerate(self.xs)}
+        self.y_map = {y: i for i, y in enumerate(self.ys)}
+
+        self.W = len(self.xs) - 1
+        self.H = len(self.ys) - 1
+
+        # Mark interior cells and build the 2D prefix sum over them
+        with span('sweep', width=self.W, height=self.H):
+            self.is_inside = interior_cells(tiles, self.x_map, self.y_map, self.W, self.H)
+        with span('prefix sum'):
+            self.P = prefix_table(self.is_inside)
+
+        # Edges as sorted (start, end) spans keyed by their fixed coordinate
+        horizontal = {}
+        vertical = {}
+        for k in range(n):
+            x1, y1 = tiles[k]
+            x2, y2 = tiles[(k + 1) % n]
+            if y1 == y2:
+                horizontal.setdefault(y1, []).append((min(x1, x2), max(x1, x2)))
+            elif x1 == x2:
+                vertical.setdefault(x1, []).append((min(y1, y2), max(y1, y2)))
+        self.horizontal = {y: self._spans(segments) for y, segments in horizontal.items()}
+        self.vertical = {x: self._spans(segments) for x, segments in vertical.items()}
+
+    @staticmethod
+    def _spans(segments):
+        segments.sort()
+        return [start for start, _ in segments], [end for _, end in segments]
+
+    @staticmethod
+    def _on_spans(spans, value):
+        if spans is None:
+            return False
+        starts, ends = spans
+        idx = bisect_right(starts, value) - 1
+        return idx >= 0 and value <= ends[idx]
+
+    def locate(self, x, y):
+        """Classify a point as INSIDE, on the BOUNDARY, or OUTSIDE the polygon."""
+        if self._on_spans(self.horizontal.get(y), x) or self._on_spans(self.vertical.get(x), y):
+            return BOUNDARY
+
+        # Off the boundary, a point shares its status with the cell up and to
+        # its right, even when it sits on a grid line
+        col = bisect_right(self.xs, x) - 1
+        row = bisect_right(self.ys, y) - 1
+        if 0 <= col < self.W and 0 <= row < self.H and self.is_inside[row, col]:
+            return INSIDE
+        return OUTSIDE
+
+    def count_valid_cells(self, ix1, iy1, ix2, iy2):
+        """Count interior cells in the compressed rectangle [ix1, ix2) x [iy1, iy2)."""
         if ix1 >= ix2 or iy1 >= iy2:
             return 0
-        return P[iy2][ix2] - P[iy1][ix2] - P[iy2][ix1] + P[iy1][ix1]
+        P = self.P
+        return P.item(iy2, ix2) - P.item(iy1, ix2) - P.item(iy2, ix1) + P.item(iy1, ix1)
 
-    def is_point_inside(px, py):
-        intersections = 0
-        for k in range(n):
-            p1 = tiles[k]
-            p2 = tiles[(k + 1) % n]
-            if p1[1] == p2[1]:
-                continue
-
-            y_min, y_max = min(p1[1], p2[1]), max(p1[1], p2[1])
-            if y_min <= py < y_max:
-                x_int = p1[0] + (py - p1[1]) * (p2[0] - p1[0]) / (p2[1] - p1[1])
-                if px < x_int:
-                    intersections += 1
-        return (intersections % 2) == 1
-
-    # Check all pairs
-    max_area = 0
-    for i in range(n):
-        for k in range(i + 1, n):
-            p1 = tiles[i]
-            p2 = tiles[k]
-
-            w = abs(p1[0] - p2[0]) + 1
-            h = abs(p1[1] - p2[1]) + 1
-            area = w * h
-
-            if area <= max_area:
-                continue
-
-            # Check validity
-            valid = False
-
-            # Case: Aligned (1D)
-            if p1[0] == p2[0] or p1[1] == p2[1]:
-                mid_x = (p1[0] + p2[0]) / 2.0
-                mid_y = (p1[1] + p2[1]) / 2.0
-
-                if is_point_inside(mid_x, mid_y):
-                    valid = True
-                else:
-                    # Check if on boundary
-                    on_boundary = False
-                    for e_idx in range(n):
-                        ep1 = tiles[e_idx]
-                        ep2 = tiles[(e_idx + 1) % n]
-                        if ep1[1] == ep2[1] == mid_y:
-                            if min(ep1[0], ep2[0]) <= mid_x <= max(ep1[0], ep2[0]):
-                                on_boundary = True
-                                break
-                        elif ep1[0] == ep2[0] == mid_x:
-                            if min(ep1[1], ep2[1]) <= mid_y <= max(ep1[1], ep2[1]):
-                                on_boundary = True
-                                break
-                    if on_boundary:
-                        valid = True
-
-            # Case: 2D Rectangle
-            else:
-                idx_x1, idx_x2 = sorted((x_map[p1[0]], x_map[p2[0]]))
-                idx_y1, idx_y2 = sorted((y_map[p1[1]], y_map[p2[1]]))
-
-                expected_cells = (idx_x2 - idx_x1) * (idx_y2 - idx_y1)
-                actual_cells = count_valid_cells(idx_x1, idx_y1, idx_x2, idx_y2)
-
-                if actual_cells == expected_cells:
-                    valid = True
-
-            if valid:
-                max_area = area
+    def is_valid_rectangle(self, p1, p2):
+        """Check that the rectangle with corners p1 and p2 uses only red and green tiles."""
+        # Case: Aligned (1D)
+        if p1[0] == p2[0] or p1[1] == p2[1]:
+            mid_x = (p1[0] + p2[0]) / 2.0
+            mid_y = (p1[1] + p2[1]) / 2.0
+            return self.locate(mid_x, mid_y) != OUTSIDE
+
+        # Case: 2D Rectangle
+        idx_x1, idx_x2 = sorted((self.x_map[p1[0]], self.x_map[p2[0]]))
+        idx_y1, idx_y2 = sorted((self.y_map[p1[1]], self.y_map[p2[1]]))
 
+        expected_cells = (idx_x2 - idx_x1) * (idx_y2 - idx_y1)
+        return self.count_valid_cells(idx_x1, idx_y1, idx_x2, idx_y2) == expected_cells
+
+
+def is_on_boundary(x, y, index):
+    """Check if a point is on the boundary formed by consecutive red tiles."""
+    return index.locate(x, y) == BOUNDARY
+
+
+def is_inside_polygon(x, y, index):
+    """Check if a point is strictly inside the polygon."""
+    return index.locate(x, y) == INSIDE
+
+
+def is_green_or_red(x, y, index):
+    """Check if a tile is red or green (on the boundary or inside)."""
+    return index.locate(x, y) != OUTSIDE
+
+
+# Default working-memory budget for batched pair validation, in bytes
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# Rough bytes of temporary arrays per pair in a batch
+BYTES_PER_PAIR = 128
+
+
+def pair_blocks(n, memory_budget=DEFAULT_MEMORY_BUDGET, start=0, stop=None):
+    """Split the pairs i < k of n tiles into blocks of whole rows.
+
+    Args:
+        n: Number of tiles
+        memory_budget: Approximate bytes of temporaries allowed per block
+        start: First row i to include
+        stop: Row i to stop before (default: all rows)
+
+    Yields:
+        Arrays (left, right) of pair indices i < k, one block at a time
+    """
+    if stop is None:
+        stop = n - 1
+    stop = min(stop, n - 1)
+    max_pairs = max(n, memory_budget // BYTES_PER_PAIR)
+    while start < stop:
+        # Take rows until the block reaches its pair budget
+        end = start + 1
+        pairs = n - 1 - start
+        while end < stop and pairs + (n - 1 - end) <= max_pairs:
+            pairs += n - 1 - end
+            end += 1
+
+        rows = np.arange(start, end)
+        counts = n - 1 - rows
+        left = np.repeat(rows, counts)
+        first = np.cumsum(counts) - counts
+        right = np.arange(len(left)) - np.repeat(first, counts) + np.repeat(rows + 1, counts)
+        yield left, right
+        start = end
+
+
+def pair_arrays(tiles, index=None):
+    """Build the per-tile arrays the batch kernels read.
+
+    Returns:
+        Dict with coordinates X, Y and, given a PolygonIndex, the compressed
+        indices CX, CY and the prefix table P
+    """
+    arrays = {
+        'X': np.array([p[0] for p in tiles], dtype=np.int64),
+        'Y': np.array([p[1] for p in tiles], dtype=np.int64),
+    }
+    if index is not None:
+        arrays['CX'] = np.array([index.x_map[p[0]] for p in tiles], dtype=np.int64)
+        arrays['CY'] = np.array([index.y_map[p[1]] for p in tiles], dtype=np.int64)
+        arrays['P'] = index.P
+    return arrays
+
+
+def best_in_rows(arrays, start=0, stop=None, memory_budget=DEFAULT_MEMORY_BUDGET,
+                 shared_best=None):
+    """Find the best rectangle among the pairs of rows [start, stop).
+
+    Each block of pairs gets its areas and, when a prefix table is present,
+    its prefix-sum rectangle counts through fancy indexing; the block maximum
+    over valid pairs is then taken in one step. Without a prefix table every
+    pair is valid. Aligned pairs need a point-location query, so they
+    are returned for the caller to check.
+
+    Args:
+        arrays: Dict from pair_arrays
+        start: First row i to scan
+        stop: Row i to stop before (default: all rows)
+        memory_budget: Approximate bytes of temporaries allowed per block
+        shared_best: Optional multiprocessing Value holding the best area found
+            by any shard; used to prune and updated with this scan's best
+
+    Returns:
+        Tuple (max_area, aligned_areas, aligned_pairs) where the aligned arrays
+        hold the aligned pairs that beat max_area when they were seen
+    """
+    X, Y = arrays['X'], arrays['Y']
+    P = arrays.get('P')
+
+    max_area = 0
+    aligned_areas = [np.empty(0, dtype=np.int64)]
+    aligned_pairs = [np.empty((0, 2), dtype=np.int64)]
+    for left, right in pair_blocks(len(X), memory_budget, start, stop):
+        floor = max_area if shared_best is None else max(max_area, shared_best.value)
+        area = (np.abs(X[left] - X[right]) + 1) * (np.abs(Y[left] - Y[right]) + 1)
+        keep = np.flatnonzero(area > floor)
+        if len(keep) == 0:
+            continue
+        left, right, area = left[keep], right[keep], area[keep]
+
+        if P is None:
+            block_best = int(area.max())
+        else:
+            CX, CY = arrays['CX'], arrays['CY']
+            aligned = (X[left] == X[right]) | (Y[left] == Y[right])
+            aligned_areas.append(area[aligned])
+            aligned_pairs.append(np.stack((left[aligned], right[aligned]), axis=1))
+
+            # Case: 2D Rectangle, valid when every compressed cell is interior
+            left, right, area = left[~aligned], right[~aligned], area[~aligned]
+            x1 = np.minimum(CX[left], CX[right])
+            x2 = np.maximum(CX[left], CX[right])
+            y1 = np.minimum(CY[left], CY[right])
+            y2 = np.maximum(CY[left], CY[right])
+            cells = P[y2, x2] - P[y1, x2] - P[y2, x1] + P[y1, x1]
+            valid = cells == (x2 - x1) * (y2 - y1)
+            block_best = int(area[valid].max()) if valid.any() else 0
+
+        if block_best > max_area:
+            max_area = block_best
+            if shared_best is not None:
+                with shared_best.get_lock():
+                    shared_best.value = max(shared_best.value, max_area)
+
+    return max_area, np.concatenate(aligned_areas), np.concatenate(aligned_pairs)
+
+
+def resolve_aligned(tiles, index, max_area, areas, pairs):
+    """Raise max_area to the largest valid aligned pair that beats it."""
+    for pos in np.argsort(-areas, kind='stable').tolist():
+        area = int(areas[pos])
+        if area <= max_area:
+            break
+        i, k = pairs[pos].tolist()
+        if index.is_valid_rectangle(tiles[i], tiles[k]):
+            return area
     return max_area
 
 
+def max_valid_area_batched(tiles, index, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """Find the largest valid rectangle by validating pairs in NumPy batches.
+
+    Args:
+        tiles: List of (x, y) polygon vertices in order
+        index: PolygonIndex for the same tiles
+        memory_budget: Approximate bytes of temporaries allowed per block
+
+    Returns:
+        The largest valid rectangle area, or 0
+    """
+    if len(tiles) < 2:
+        return 0
+
+    max_area, areas, pairs = best_in_rows(pair_arrays(tiles, index), memory_budget=memory_budget)
+    return resolve_aligned(tiles, index, max_area, areas, pairs)
+
+
+def shard_rows(n, shards):
+    """Split rows 0..n-2 of the pair triangle into ranges with similar pair counts."""
+    total = n * (n - 1) // 2
+    bounds = [0]
+    done = 0
+    for row in range(n - 1):
+        done += n - 1 - row
+        if done * shards >= total * len(bounds) and len(bounds) < shards:
+            bounds.append(row + 1)
+    if bounds[-1] != n - 1:
+        bounds.append(n - 1)
+    return list(zip(bounds, bounds[1:]))
+
+
+# Shared-memory views and best-area Value attached in each worker process
+_shard_state = {}
+
+
+def _attach_shard(specs, shared_best, memory_budget):
+    """Pool initializer: map the shared arrays into this worker once."""
+    blocks = {}
+    arrays = {}
+    for name, (shm_name, shape, dtype) in specs.items():
+        blocks[name] = shared_memory.SharedMemory(name=shm_name)
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf)
+    _shard_state.update(blocks=blocks, arrays=arrays, best=shared_best,
+                        memory_budget=memory_budget)
+
+
+def _search_shard(rows):
+    """Scan one shard of rows against the shared arrays."""
+    start, stop = rows
+    return best_in_rows(_shard_state['arrays'], start, stop,
+                        _shard_state['memory_budget'], _shard_state['best'])
+
+
+def max_area_sharded(tiles, index=None, workers=None, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """Search the pair triangle in parallel worker processes.
+
+    The tile arrays (and prefix table, given an index) are placed in shared
+    memory once, so shards carry only their row range. Workers share the best
+    area found so far through a shared Value and prune pairs that cannot beat
+    it.
+
+    Args:
+        tiles: List of (x, y) coordinates
+        index: PolygonIndex to validate rectangles against, or None to accept
+            every pair
+        workers: Number of processes (default: CPU count)
+        memory_budget: Approximate bytes of temporaries per block in each worker
+
+    Returns:
+        The largest (valid) rectangle area, or 0
+    """
+    if len(tiles) < 2:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    arrays = pair_arrays(tiles, index)
+    blocks = []
+    specs = {}
+    try:
+        for name, array in arrays.items():
+            block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            blocks.append(block)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            specs[name] = (block.name, array.shape, array.dtype.str)
+
+        shared_best = multiprocessing.Value('q', 0)
+        shards = shard_rows(len(tiles), workers * 4)
+        results = []
+        with multiprocessing.Pool(workers, initializer=_attach_shard,
+                                  initargs=(specs, shared_best, memory_budget)) as pool:
+            for result in pool.imap_unordered(_search_shard, shards):
+                results.append(result)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    max_area = max(area for area, _, _ in results)
+    if index is None:
+        return max_area
+
+    areas = np.concatenate([areas for _, areas, _ in results])
+    pairs = np.concatenate([pairs for _, _, pairs in results])
+    return resolve_aligned(tiles, index, max_area, areas, pairs)
+
+
+# Inputs with at least this many tiles use batched validation by default
+BATCH_MIN_TILES = 256
+
+
+def part2(tiles, batch=None, memory_budget=DEFAULT_MEMORY_BUDGET, workers=None):
+    """Find the largest rectangle using only red and green tiles.
+
+    Args:
+        tiles: List of (x, y) polygon vertices in order
+        batch: Validate pairs in NumPy batches; None picks by input size
+        memory_budget: Approximate bytes of temporaries per batch
+        workers: Shard the pair search over this many processes
+    """
+    index = PolygonIndex(tiles)
+
+    if workers is not None and workers > 1:
+        return max_area_sharded(tiles, index, workers, memory_budget)
+
+    if batch is None:
+        batch = len(tiles) >= BATCH_MIN_TILES
+    if batch:
+        with span('pair search', batched=True):
+            return max_valid_area_batched(tiles, index, memory_budget)
+
+    # Visit pairs from the largest area down; the first valid one wins
+    with span('pair search', batched=False):
+        for area, i, k in pairs_by_area(tiles):
+            if index.is_valid_rectangle(tiles[i], tiles[k]):
+                return area
+
+    return 0
+
+
 def main():
     # Get day number from filename
     day = int(Path(__file__).stem.split('_')[1])
+    profiler = PhaseProfiler.from_command_line(f"day_{day:02d}")
 
     # Read and parse input
     raw_input = read_input(day)
-    data = parse_input(raw_input)
+    with profiler.phase('parse'):
+        data = parse_input(raw_input)
 
     # Solve and print results
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    with profiler.phase('part1'):
+        answer1 = part1(data)
+    print(f"Part 1: {answer1}")
+    with profiler.phase('part2'):
+        answer2 = part2(data)
+    print(f"Part 2: {answer2}")
+    profiler.print_report()
 
 
 if __name__ == "__main__":
@@ -6,208 +6,771 @@ Solve "Lights Out" puzzle using Gaussian elimination over GF(2).
 """
 
 import sys
+import time
+import struct
+import argparse
+from array import array
+from collections import namedtuple
 from pathlib import Path
-import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
 
 # Add parent directory to path to import utils
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils import read_input
+from utils.cache import CACHE_DIR, LRUCache, source_dependencies, sources_digest
+from utils.profiling import PhaseProfiler, add_profiling_arguments
 
 
-def parse_input(data: str):
-    """Parse the input data into machines."""
-    machines = []
-    lines = data.strip().split('\n')
+# One machine as read from a Fleet: light and button bitmasks plus joltages
+Machine = namedtuple('Machine', ['n_lights', 'target', 'buttons', 'joltages'])
 
-    for line in lines:
-        # Extract indicator lights pattern
-        light_match = re.search(r'\[([.#]+)\]', line)
-        lights = light_match.group(1)
+# Binary fleet format: magic, version, machines, buttons, lights, mask words
+FLEET_MAGIC = b'AOC10FLT'
+FLEET_VERSION = 1
+FLEET_HEADER = struct.Struct('<8sIQQQQ')
 
-        # Extract button configurations
-        buttons = []
-        for button_match in re.finditer(r'\(([0-9,]+)\)', line):
-            button_lights = [int(x) for x in button_match.group(1).split(',')]
-            buttons.append(button_lights)
+# '.' / '#' to '0' / '1', for reading an indicator pattern as a binary number
+_LIGHT_DIGITS = str.maketrans('.#', '01')
 
-        # Extract joltage requirements
-        joltage_match = re.search(r'\{([0-9,]+)\}', line)
-        joltages = [int(x) for x in joltage_match.group(1).split(',')]
 
-        machines.append({
-            'target': lights,
-            'buttons': buttons,
-            'joltages': joltages
-        })
+def _to_little_endian(values):
+    """Byte-swap an array in place on big-endian hosts (the file format is LE)."""
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
 
-    return machines
 
+class Fleet:
+    """
+    All machines packed into flat arrays.
 
-def solve_lights_out(target, buttons):
+    Machine m owns lights light_offsets[m]:light_offsets[m + 1] (its joltages
+    live at the same positions in `joltages`) and buttons
+    button_offsets[m]:button_offsets[m + 1] of `buttons`. Targets and buttons
+    are light bitmasks.
     """
-    Solve the lights out puzzle using Gaussian elimination over GF(2).
-    Returns the minimum number of button presses, or None if impossible.
+
+    def __init__(self, light_offsets, button_offsets, targets, buttons, joltages):
+        self.light_offsets = light_offsets
+        self.button_offsets = button_offsets
+        self.targets = targets
+        self.buttons = buttons
+        self.joltages = joltages
+
+    def __len__(self):
+        return len(self.targets)
+
+    def __getitem__(self, m):
+        lights_start, lights_end = self.light_offsets[m], self.light_offsets[m + 1]
+        buttons_start, buttons_end = self.button_offsets[m], self.button_offsets[m + 1]
+        return Machine(
+            lights_end - lights_start,
+            self.targets[m],
+            tuple(self.buttons[buttons_start:buttons_end]),
+            tuple(self.joltages[lights_start:lights_end]),
+        )
+
+    def __iter__(self):
+        return (self[m] for m in range(len(self)))
+
+    def save(self, path):
+        """Write the fleet in the compact binary format."""
+        max_lights = max((self.light_offsets[m + 1] - self.light_offsets[m]
+                          for m in range(len(self))), default=0)
+        words = max(1, -(-max_lights // 64))
+        width = 8 * words
+
+        with open(path, 'wb') as f:
+            f.write(FLEET_HEADER.pack(FLEET_MAGIC, FLEET_VERSION, len(self.targets),
+                                      len(self.buttons), len(self.joltages), words))
+            for values in (self.light_offsets, self.button_offsets, self.joltages):
+                f.write(_to_little_endian(array('q', values)).tobytes())
+            if words == 1:
+                f.write(_to_little_endian(array('Q', self.targets + self.buttons)).tobytes())
+            else:
+                f.write(b''.join(mask.to_bytes(width, 'little')
+                                 for mask in self.targets + self.buttons))
+
+    @classmethod
+    def load(cls, path):
+        """Read a fleet written by save()."""
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, n_machines, n_buttons, n_lights, words = \
+            FLEET_HEADER.unpack_from(data)
+        if magic != FLEET_MAGIC or version != FLEET_VERSION:
+            raise ValueError(f"{path} is not a version {FLEET_VERSION} fleet file")
+
+        pos = FLEET_HEADER.size
+        columns = []
+        for count in (n_machines + 1, n_machines + 1, n_lights):
+            values = array('q')
+            values.frombytes(data[pos:pos + 8 * count])
+            columns.append(_to_little_endian(values))
+            pos += 8 * count
+
+        n_masks = n_machines + n_buttons
+        if words == 1:
+            masks = array('Q')
+            masks.frombytes(data[pos:pos + 8 * n_masks])
+            masks = _to_little_endian(masks).tolist()
+        else:
+            width = 8 * words
+            masks = [int.from_bytes(data[pos + i * width:pos + (i + 1) * width], 'little')
+                     for i in range(n_masks)]
+
+        light_offsets, button_offsets, joltages = columns
+        return cls(light_offsets, button_offsets, masks[:n_machines], masks[n_machines:],
+                   joltages)
+
+
+def parse_input(data: str):
     """
-    n_lights = len(target)
-    n_buttons = len(buttons)
-
-    # Convert target to binary (0 = off, 1 = on)
-    target_state = [1 if c == '#' else 0 for c in target]
-
-    # Build augmented matrix for Gaussian elimination
-    matrix = []
-    for light_idx in range(n_lights):
-        row = [0] * (n_buttons + 1)
-        for button_idx, button in enumerate(buttons):
-            if light_idx in button:
-                row[button_idx] = 1
-        row[n_buttons] = target_state[light_idx]
-        matrix.append(row)
-
-    # Gaussian elimination to reduced row echelon form
-    pivot_cols = []
-    current_row = 0
-
-    for col in range(n_buttons):
-        # Find pivot
-        pivot_row = None
-        for row in range(current_row, n_lights):
-            if matrix[row][col] == 1:
-                pivot_row = row
-                break
+    Parse the input data into a Fleet in a single pass over the lines.
 
-        if pivot_row is None:
+    Each line is '[.##.] (3) (1,3) ... {3,5,4,7}': the indicator pattern,
+    the buttons and the joltage requirements, separated by spaces.
+    """
+    light_offsets = array('q', [0])
+    button_offsets = array('q', [0])
+    targets = []
+    buttons = []
+    joltages = array('q')
+
+    for line in data.split('\n'):
+        tokens = line.split()
+        if not tokens:
             continue
 
-        # Swap rows
-        if pivot_row != current_row:
-            matrix[current_row], matrix[pivot_row] = matrix[pivot_row], matrix[current_row]
+        # Indicator pattern, read right-to-left so light i is bit i
+        lights = tokens[0][1:-1]
+        targets.append(int(lights[::-1].translate(_LIGHT_DIGITS), 2))
+
+        # Button configurations
+        for token in tokens[1:-1]:
+            mask = 0
+            for light_idx in token[1:-1].split(','):
+                mask |= 1 << int(light_idx)
+            buttons.append(mask)
 
-        pivot_cols.append(col)
+        # Joltage requirements
+        joltages.extend(map(int, tokens[-1][1:-1].split(',')))
 
-        # Eliminate all other rows
-        for row in range(n_lights):
-            if row != current_row and matrix[row][col] == 1:
-                for c in range(n_buttons + 1):
-                    matrix[row][c] ^= matrix[current_row][c]
+        light_offsets.append(len(joltages))
+        button_offsets.append(len(buttons))
+
+    return Fleet(light_offsets, button_offsets, targets, buttons, joltages)
+
+
+def dump_parsed(fleet, path):
+    """Parsed-input cache hook: store the fleet in its binary format."""
+    fleet.save(path)
+
+
+def load_parsed(path):
+    """Parsed-input cache hook: read a fleet stored by dump_parsed."""
+    return Fleet.load(path)
+
+
+def lights_mask(target):
+    """Pack an indicator pattern like '.##.' into a bitmask (bit i = light i on)."""
+    mask = 0
+    for light_idx, c in enumerate(target):
+        if c == '#':
+            mask |= 1 << light_idx
+    return mask
+
+
+def button_masks(buttons):
+    """Pack each button's list of lights into a bitmask."""
+    masks = []
+    for button in buttons:
+        mask = 0
+        for light_idx in button:
+            mask |= 1 << light_idx
+        masks.append(mask)
+    return masks
+
+
+def gf2_solve(target, masks):
+    """
+    Solve masks * x = target over GF(2) with bitmask Gaussian elimination.
 
-        current_row += 1
+    Each button's light mask is reduced against an XOR basis keyed by its
+    highest set bit, tracking which buttons were combined. Buttons that reduce
+    to zero give the null space; reducing the target gives one solution.
 
-    # Check for contradictions
-    for row in range(current_row, n_lights):
-        if matrix[row][n_buttons] == 1:
+    Args:
+        target: Bitmask of lights that must end up on
+        masks: Bitmask of lights toggled by each button
+
+    Returns:
+        Tuple (solution, null_basis) of button bitmasks, or None if impossible
+    """
+    basis = {}
+    null_basis = []
+    for button_idx, vector in enumerate(masks):
+        combo = 1 << button_idx
+        while vector:
+            pivot = vector.bit_length() - 1
+            if pivot not in basis:
+                basis[pivot] = (vector, combo)
+                break
+            pivot_vector, pivot_combo = basis[pivot]
+            vector ^= pivot_vector
+            combo ^= pivot_combo
+        else:
+            null_basis.append(combo)
+
+    solution = 0
+    vector = target
+    while vector:
+        pivot = vector.bit_length() - 1
+        if pivot not in basis:
             return None  # No solution
+        pivot_vector, pivot_combo = basis[pivot]
+        vector ^= pivot_vector
+        solution ^= pivot_combo
+
+    return solution, null_basis
+
+
+# Up to this many free variables, Gray-code enumeration is cheapest
+GRAY_CODE_MAX_FREE = 25
 
-    # Find free variables (columns not in pivot_cols)
-    free_vars = [col for col in range(n_buttons) if col not in pivot_cols]
+# Largest rank whose 2^rank distance table the free-variable split builds
+SPLIT_MAX_RANK = 24
+
+# Roughly how many NumPy element operations of the split cost as much as
+# storing one syndrome in the search (about 1.5 ns vs 1.7 us when measured)
+SPLIT_OPS_PER_STEP = 1024
+
+
+def min_weight_gray(solution, null_basis):
+    """
+    Minimum popcount over solution XOR any combination of null_basis vectors.
+
+    Walks the combinations in Gray-code order, so each step flips exactly one
+    null-space vector: one XOR and one popcount per combination.
+    """
+    min_presses = solution.bit_count()
+    candidate = solution
+    for step in range(1, 1 << len(null_basis)):
+        # The lowest set bit of the step number is the vector to flip
+        candidate ^= null_basis[(step & -step).bit_length() - 1]
+        presses = candidate.bit_count()
+        if presses < min_presses:
+            min_presses = presses
+    return min_presses
+
+
+def half_combinations(codes):
+    """
+    All XOR combinations of the given codes, with how many codes each uses.
 
-    # If no free variables, there's only one solution
-    if not free_vars:
-        solution = [0] * n_buttons
-        for i, col in enumerate(pivot_cols):
-            solution[col] = matrix[i][n_buttons]
-        return sum(solution)
+    Built by doubling: each code adds a copy of the table XORed with it.
 
-    # Enumerate all combinations of free variables to find minimum
-    min_presses = float('inf')
+    Returns:
+        Tuple (combos, counts) of NumPy arrays of length 2^len(codes)
+    """
+    combos = np.zeros(1, dtype=np.int64)
+    counts = np.zeros(1, dtype=np.int16)
+    for code in codes:
+        combos = np.concatenate((combos, combos ^ code))
+        counts = np.concatenate((counts, counts + 1))
+    return combos, counts
 
-    for mask in range(1 << len(free_vars)):
-        solution = [0] * n_buttons
 
-        # Set free variables according to mask
-        for i, var in enumerate(free_vars):
-            solution[var] = (mask >> i) & 1
+def min_weight_split(solution, null_basis):
+    """
+    Minimum popcount over solution XOR any combination of null_basis vectors,
+    by splitting the free variables into two halves.
+
+    The null basis is put in reduced form so each vector owns one free button
+    no other vector touches. A combination's weight is then the number of
+    vectors chosen plus the popcount of its pattern on the remaining (pivot)
+    buttons, of which there are at most rank. The first half's combinations go
+    into a table over pivot patterns holding the fewest vectors that produce
+    each pattern; one pass per bit turns it into the fewest vectors plus
+    Hamming distance to any pattern. Each second-half combination then looks
+    up its exact best partner, so the cost is O(2^(f/2) + rank * 2^rank)
+    instead of O(2^f).
+    """
+    # Reduce so that each vector owns a distinct free button
+    vectors = list(null_basis)
+    free_mask = 0
+    for idx, vector in enumerate(vectors):
+        bit = vector & -vector
+        free_mask |= bit
+        for other in range(len(vectors)):
+            if other != idx and vectors[other] & bit:
+                vectors[other] ^= vector
+        if solution & bit:
+            solution ^= vector
+
+    # Compress the remaining buttons into dense pivot patterns
+    rest = solution & ~free_mask
+    for vector in vectors:
+        rest |= vector & ~free_mask
+    positions = [bit for bit in range(rest.bit_length()) if rest >> bit & 1]
+
+    def compress(value):
+        return sum(1 << k for k, bit in enumerate(positions) if value >> bit & 1)
+
+    codes = [compress(vector) for vector in vectors]
+    half = len(codes) // 2
+
+    # Fewest first-half vectors producing each pattern, then spread by distance
+    unreached = np.iinfo(np.int16).max // 2
+    table = np.full(1 << len(positions), unreached, dtype=np.int16)
+    combos, counts = half_combinations(codes[:half])
+    np.minimum.at(table, combos, counts)
+    for bit in range(len(positions)):
+        pairs = table.reshape(-1, 2, 1 << bit)
+        low, high = pairs[:, 0, :].copy(), pairs[:, 1, :]
+        np.minimum(low, high + 1, out=pairs[:, 0, :])
+        np.minimum(high, low + 1, out=pairs[:, 1, :])
+
+    combos, counts = half_combinations(codes[half:])
+    return int((counts + table[combos ^ compress(solution)]).min())
+
+
+def min_weight_mitm(target, masks, budget=None):
+    """
+    Minimum presses to reach target, by meeting in the middle over light patterns.
+
+    Grows a ball of reachable light patterns (syndromes) from all-off and one
+    from the target, one press at a time, always extending the smaller side.
+    Each side keeps a dict from syndrome to presses; the first layer that
+    reaches a syndrome the other side has stored gives the answer. The number
+    of syndromes is bounded by 2^rank, and the work grows with the number of
+    button subsets of half the answer's size, so it is cheap when the answer
+    is small or the rank is low.
+
+    Returns:
+        The minimum presses, or None if more than ``budget`` syndromes would be
+        stored (or the target is unreachable)
+    """
+    if target == 0:
+        return 0
+
+    # Duplicate and no-op buttons never appear in an optimal solution
+    masks = sorted(set(mask for mask in masks if mask))
+
+    seen = [{0: 0}, {target: 0}]
+    frontier = [[0], [target]]
+    depth = [0, 0]
+    while frontier[0] and frontier[1]:
+        side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+        here, there = seen[side], seen[1 - side]
+        depth[side] += 1
+
+        min_presses = None
+        next_frontier = []
+        room = budget - len(there) if budget is not None else None
+        for syndrome in frontier[side]:
+            for mask in masks:
+                reached = syndrome ^ mask
+                if reached in here:
+                    continue
+                here[reached] = depth[side]
+                if room is not None and len(here) > room:
+                    return None
+                next_frontier.append(reached)
+                if reached in there:
+                    presses = depth[side] + there[reached]
+                    if min_presses is None or presses < min_presses:
+                        min_presses = presses
+
+        if min_presses is not None:
+            return min_presses
+        frontier[side] = next_frontier
+
+    return None
+
+
+def lights_out_presses(target, masks):
+    """Minimum button presses to reach the target lights mask, or None."""
+    result = gf2_solve(target, masks)
+    if result is None:
+        return None
+    solution, null_basis = result
 
-        # Determine dependent variables
-        for i, col in enumerate(pivot_cols):
-            val = matrix[i][n_buttons]
-            for j in range(col + 1, n_buttons):
-                val ^= (matrix[i][j] & solution[j])
-            solution[col] = val
+    if len(null_basis) <= GRAY_CODE_MAX_FREE:
+        return min_weight_gray(solution, null_basis)
 
-        # Count button presses
-        presses = sum(solution)
-        min_presses = min(min_presses, presses)
+    rank = len(masks) - len(null_basis)
+    if rank > SPLIT_MAX_RANK:
+        return min_weight_mitm(target, masks)
 
-    return min_presses if min_presses != float('inf') else None
+    # Try the syndrome search first, within what the split would cost
+    split_cost = (1 << (len(null_basis) + 1) // 2) + rank * (1 << rank)
+    presses = min_weight_mitm(target, masks, budget=split_cost // SPLIT_OPS_PER_STEP)
+    if presses is None:
+        presses = min_weight_split(solution, null_basis)
+    return presses
 
 
-def part1(machines):
-    """Find the minimum button presses for all machines."""
-    total = 0
-    for machine in machines:
-        min_presses = solve_lights_out(machine['target'], machine['buttons'])
-        if min_presses is None:
-            return None  # Should not happen with valid input
-        total += min_presses
-    return total
+def solve_lights_out(target, buttons):
+    """
+    Solve the lights out puzzle using Gaussian elimination over GF(2).
+    Returns the minimum number of button presses, or None if impossible.
+    """
+    return lights_out_presses(lights_mask(target), button_masks(buttons))
+
+
+def mask_lights(mask):
+    """List the light (counter) indices set in a bitmask."""
+    lights = []
+    while mask:
+        lights.append((mask & -mask).bit_length() - 1)
+        mask &= mask - 1
+    return lights
+
+
+def press_patterns(parity, masks, buttons, n_counters):
+    """
+    List every set of buttons, each pressed once, that leaves exactly the
+    counters in the parity mask odd.
+
+    Returns:
+        List of (presses, increments) with increments a per-counter tuple
+    """
+    result = gf2_solve(parity, masks)
+    if result is None:
+        return []
+    solution, null_basis = result
+
+    patterns = []
+    combo = solution
+    for step in range(1 << len(null_basis)):
+        if step:
+            combo ^= null_basis[(step & -step).bit_length() - 1]
+        increments = [0] * n_counters
+        remaining = combo
+        while remaining:
+            button_idx = (remaining & -remaining).bit_length() - 1
+            for counter_idx in buttons[button_idx]:
+                increments[counter_idx] += 1
+            remaining &= remaining - 1
+        patterns.append((combo.bit_count(), tuple(increments)))
+
+    # Cheapest patterns first, so the bound in joltage_presses prunes sooner
+    patterns.sort()
+    return patterns
+
+
+def joltage_presses(targets, masks):
+    """
+    Minimum presses so each counter reaches its target, with each button (a
+    counter bitmask) adding 1 to every counter it sets. Returns None if the
+    targets are unreachable.
+
+    Exact parity-halving recursion: in any solution the buttons pressed an odd
+    number of times must flip exactly the odd counters, which is the GF(2)
+    problem from part1. Pressing those once leaves even targets, and the rest
+    of the presses come in pairs, so the remainder is the same problem at half
+    the targets. Results are memoized on the residual target vector and press
+    patterns on the parity mask.
+    """
+    buttons = [mask_lights(mask) for mask in masks]
+    n_counters = len(targets)
+    patterns = {}
+    memo = {}
+
+    widest = max((len(button) for button in buttons), default=1)
+
+    def solve(residual):
+        if residual in memo:
+            return memo[residual]
+        if not any(residual):
+            return 0
+
+        parity = 0
+        for counter_idx, value in enumerate(residual):
+            if value & 1:
+                parity |= 1 << counter_idx
+        if parity not in patterns:
+            patterns[parity] = press_patterns(parity, masks, buttons, n_counters)
+
+        best = None
+        for presses, increments in patterns[parity]:
+            half = tuple((value - inc) >> 1 for value, inc in zip(residual, increments))
+            if min(half) < 0:
+                continue
+            # Each press adds 1 to at most `widest` counters, so the remaining
+            # half needs at least this many presses; skip patterns that cannot win
+            if best is not None:
+                bound = max(max(half), -(-sum(half) // widest))
+                if presses + 2 * bound >= best:
+                    continue
+            sub = solve(half)
+            if sub is not None and (best is None or presses + 2 * sub < best):
+                best = presses + 2 * sub
+
+        memo[residual] = best
+        return best
+
+    return solve(tuple(targets))
 
 
 def solve_joltage(targets, buttons):
     """
-    Solve the joltage configuration problem using integer linear programming.
+    Solve the joltage configuration problem as an exact integer program.
     Returns the minimum number of button presses to reach target joltage levels.
     """
-    from scipy.optimize import linprog
-    import numpy as np
+    return joltage_presses(targets, button_masks(buttons))
 
-    n_counters = len(targets)
-    n_buttons = len(buttons)
-
-    # Build constraint matrix: A_eq * x = b_eq
-    # Each row represents a counter, each column represents a button
-    A_eq = np.zeros((n_counters, n_buttons))
-    for button_idx, button in enumerate(buttons):
-        for counter_idx in button:
-            A_eq[counter_idx, button_idx] = 1
-
-    b_eq = np.array(targets, dtype=float)
-
-    # Objective: minimize sum of button presses
-    c = np.ones(n_buttons)
-
-    # Bounds: each button can be pressed 0 or more times
-    bounds = [(0, None) for _ in range(n_buttons)]
-
-    # Solve using linear programming with integer constraints
-    result = linprog(
-        c,
-        A_eq=A_eq,
-        b_eq=b_eq,
-        bounds=bounds,
-        method='highs',
-        integrality=[1] * n_buttons  # All variables must be integers
-    )
-
-    if result.success:
-        return int(round(result.fun))
+
+def solve_machine(kind, machine):
+    """Solve one Machine's 'lights' (part1) or 'joltage' (part2) problem."""
+    if kind == 'lights':
+        return lights_out_presses(machine.target, machine.buttons)
+    return joltage_presses(machine.joltages, machine.buttons)
+
+
+def canonical_key(kind, machine):
+    """
+    Signature shared by machines that are the same up to button order and
+    light relabelling.
+
+    Lights are ordered by an invariant (target bit, joltage for part2, and the
+    sizes of the buttons that touch them), ties kept in input order, then the
+    button bitmasks are rewritten in that order and sorted. Equal keys always
+    describe isomorphic machines, so they share an answer.
+    """
+    masks = machine.buttons
+    joltages = machine.joltages if kind == 'joltage' else None
+
+    def invariant(light_idx):
+        sizes = sorted(mask.bit_count() for mask in masks if (mask >> light_idx) & 1)
+        joltage = joltages[light_idx] if joltages is not None else 0
+        return (machine.target >> light_idx) & 1, joltage, len(sizes), sizes
+
+    order = sorted(range(machine.n_lights), key=invariant)
+
+    def relabel(mask):
+        new_mask = 0
+        for new_idx, light_idx in enumerate(order):
+            if (mask >> light_idx) & 1:
+                new_mask |= 1 << new_idx
+        return new_mask
+
+    new_joltages = None
+    if joltages is not None:
+        new_joltages = tuple(joltages[light_idx] for light_idx in order)
+    return (kind, machine.n_lights, relabel(machine.target),
+            tuple(sorted(relabel(mask) for mask in masks)), new_joltages)
+
+
+def expected_cost(kind, machine):
+    """Rough solve cost for scheduling: free variables, then size of the problem."""
+    free_vars = len(gf2_solve(0, machine.buttons)[1])
+    scale = max(machine.joltages, default=0) if kind == 'joltage' else 0
+    return free_vars, len(machine.buttons), scale
+
+
+def _timed_solve(kind, machine_idx, machine):
+    """Solve one machine and time it."""
+    start = time.perf_counter()
+    result = solve_machine(kind, machine)
+    return machine_idx, result, time.perf_counter() - start
+
+
+def _timed_solve_chunk(kind, chunk):
+    """Worker task: solve a chunk of (machine_idx, machine) pairs, timing each."""
+    return [_timed_solve(kind, machine_idx, machine) for machine_idx, machine in chunk]
+
+
+# Pool tasks per worker process; each task carries a chunk of machines
+CHUNKS_PER_JOB = 4
+
+
+# Marks a cache miss (None is a valid cached answer)
+_MISSING = object()
+
+
+def solve_machines(machines, kind, jobs=None, cache=None):
+    """
+    Solve every machine, optionally in a process pool.
+
+    Machines are first reduced to their canonical_key; only one machine per
+    key not already in the cache is solved, and repeats cost a lookup. With
+    jobs > 1 the machines to solve are sorted longest-expected-first and dealt
+    round-robin into CHUNKS_PER_JOB chunks per worker, so each pool task
+    amortises its overhead over many machines and the slow ones are spread
+    across chunks. Results are collected as chunks complete.
+
+    Args:
+        machines: Fleet (or any sequence of Machine)
+        kind: 'lights' for part1 or 'joltage' for part2
+        jobs: Number of worker processes (None or 1 solves in-process)
+        cache: LRUCache of answers by canonical key (default: a fresh one)
+
+    Returns:
+        Tuple (results, timings): per-machine answers in input order, and a
+        dict from machine index to solve time for the machines actually
+        solved (cached and repeated machines have no entry)
+    """
+    if cache is None:
+        cache = LRUCache()
+
+    machines = list(machines)
+    keys = [canonical_key(kind, machine) for machine in machines]
+    answers = {}
+    pending = []
+    for machine_idx, key in enumerate(keys):
+        if key in answers:
+            continue
+        answers[key] = cache.get(key, _MISSING)
+        if answers[key] is _MISSING:
+            pending.append(machine_idx)
+
+    timings = {}
+    if jobs is None or jobs <= 1:
+        solved = (_timed_solve(kind, idx, machines[idx]) for idx in pending)
+        for machine_idx, result, elapsed in solved:
+            answers[keys[machine_idx]] = result
+            timings[machine_idx] = elapsed
     else:
-        return None
+        pending.sort(key=lambda idx: expected_cost(kind, machines[idx]), reverse=True)
+        n_chunks = min(len(pending), jobs * CHUNKS_PER_JOB)
+        chunks = [[(idx, machines[idx]) for idx in pending[first::n_chunks]]
+                  for first in range(n_chunks)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_timed_solve_chunk, kind, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for machine_idx, result, elapsed in future.result():
+                    answers[keys[machine_idx]] = result
+                    timings[machine_idx] = elapsed
+
+    for machine_idx in pending:
+        cache.put(keys[machine_idx], answers[keys[machine_idx]])
+
+    return [answers[key] for key in keys], timings
+
+
+def timing_report(timings, n_machines=None, slowest=5):
+    """
+    Summarize per-machine solve times: percentiles and the slowest machines.
+
+    Args:
+        timings: Dict from machine index to solve time, for solved machines only
+        n_machines: Fleet size, to report how many answers were reused
+        slowest: Number of slowest machines to list
+    """
+    if not timings:
+        return "No machines solved"
+
+    ordered = sorted(timings.values())
+
+    def percentile(fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    reused = ""
+    if n_machines is not None:
+        reused = f" ({n_machines - len(ordered)} of {n_machines} cached or repeated)"
+    lines = [
+        f"Solved: {len(ordered)}{reused}  total {sum(ordered):.3f}s",
+        f"min {ordered[0] * 1000:.2f}ms  median {percentile(0.5) * 1000:.2f}ms  "
+        f"p90 {percentile(0.9) * 1000:.2f}ms  p99 {percentile(0.99) * 1000:.2f}ms  "
+        f"max {ordered[-1] * 1000:.2f}ms",
+    ]
+    worst = sorted(timings, key=timings.get, reverse=True)[:slowest]
+    lines.append("Slowest: " + ", ".join(f"#{idx} {timings[idx] * 1000:.2f}ms" for idx in worst))
+    return "\n".join(lines)
+
+
+def total_presses(machines, kind, jobs=None, timings=None, cache=None):
+    """Sum the minimum presses over all machines, or None if any is impossible."""
+    results, machine_timings = solve_machines(machines, kind, jobs, cache)
+    if timings is not None:
+        timings.update(machine_timings)
+    if any(result is None for result in results):
+        return None  # Should not happen with valid input
+    return sum(results)
+
+
+def part1(machines, jobs=None, timings=None, cache=None):
+    """Find the minimum button presses for all machines.
+
+    Args:
+        machines: Fleet from parse_input
+        jobs: Solve machines in this many worker processes
+        timings: Optional dict that receives the solve time of each machine
+            actually solved, by machine index
+        cache: Optional LRUCache of answers shared across calls
+    """
+    return total_presses(machines, 'lights', jobs, timings, cache)
 
 
-def part2(machines):
-    """Find the minimum button presses for joltage configuration."""
-    total = 0
-    for machine in machines:
-        min_presses = solve_joltage(machine['joltages'], machine['buttons'])
-        if min_presses is None:
-            return None  # Should not happen with valid input
-        total += min_presses
-    return total
+def part2(machines, jobs=None, timings=None, cache=None):
+    """Find the minimum button presses for joltage configuration.
+
+    Args:
+        machines: Fleet from parse_input
+        jobs: Solve machines in this many worker processes
+        timings: Optional dict that receives the solve time of each machine
+            actually solved, by machine index
+        cache: Optional LRUCache of answers shared across calls
+    """
+    return total_presses(machines, 'joltage', jobs, timings, cache)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Advent of Code 2025 - Day 10: Factory")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='solve machines in N worker processes')
+    parser.add_argument('--timings', action='store_true',
+                        help='report the per-machine solve time distribution')
+    parser.add_argument('--cache', action='store_true',
+                        help='keep machine answers on disk between runs of the same source')
+    parser.add_argument('--binary', type=Path, default=None,
+                        help='load the fleet from this binary file, writing it first if missing')
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+
     # Get day number from filename
     day = int(Path(__file__).stem.split('_')[1])
+    profiler = PhaseProfiler.from_args(f"day_{day:02d}", args)
 
     # Read and parse input
-    raw_input = read_input(day)
-    data = parse_input(raw_input)
+    with profiler.phase('parse'):
+        if args.binary is not None and args.binary.exists():
+            data = Fleet.load(args.binary)
+        else:
+            raw_input = read_input(day)
+            data = parse_input(raw_input)
+            if args.binary is not None:
+                data.save(args.binary)
 
     # Solve and print results
-    print(f"Part 1: {part1(data)}")
-    print(f"Part 2: {part2(data)}")
+    # The on-disk store is per source version, so stale answers are never reused
+    shelf = None
+    if args.cache:
+        digest = sources_digest(source_dependencies(__file__))[:16]
+        shelf = CACHE_DIR / f"day_10_machines_{digest}"
+    cache = LRUCache(path=shelf)
+    part1_timings = {}
+    part2_timings = {}
+    with profiler.phase('part1'):
+        answer1 = part1(data, args.jobs, part1_timings, cache)
+    print(f"Part 1: {answer1}")
+    with profiler.phase('part2'):
+        answer2 = part2(data, args.jobs, part2_timings, cache)
+    print(f"Part 2: {answer2}")
+    cache.close()
+
+    if args.timings:
+        print("\nPart 1 solve times")
+        print(timing_report(part1_timings, len(data)))
+        print("\nPart 2 solve times")
+        print(timing_report(part2_timings, len(data)))
+    profiler.print_report()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 """Algorithm utility functions for Advent of Code."""
 
+from array import array
 from collections import deque
-from typing import Callable, Tuple, Optional, Any
-from heapq import heappush, heappop
+from typing import Callable, Iterable, List, Tuple, Optional, Any
+from heapq import heappush, heappop, nlargest
 
 
 def bfs(start, is_goal: Callable, get_neighbors: Callable) -> Optional[Any]:
@@ -111,3 +112,79 @@ def binary_search(predicate: Callable[[int], bool], low: int, high: int) -> int:
         else:
             low = mid + 1
     return low
+
+
+class UnionFind:
+    """Array-backed disjoint-set (Union-Find) over the integers 0..n-1.
+
+    Uses iterative path halving and union by size, and keeps the number of
+    components and the set of roots up to date so connectivity queries do not
+    need a scan over every element.
+    """
+
+    def __init__(self, n: int):
+        self.parent = array('i', range(n))
+        self.sizes = array('i', [1]) * n
+        self.num_components = n
+        self.roots = set(range(n))
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        """Find the root of x, halving the path along the way."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Union the sets containing x and y.
+
+        Returns:
+            True if two sets were merged, False if already connected
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+
+        if root_x == root_y:
+            return False
+
+        # Attach the smaller tree under the larger one
+        if self.sizes[root_x] < self.sizes[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.sizes[root_x] += self.sizes[root_y]
+        self.roots.discard(root_y)
+        self.num_components -= 1
+
+        return True
+
+    def union_many(self, xs: Iterable[int], ys: Iterable[int]) -> int:
+        """Union each pair (xs[i], ys[i]), e.g. from parallel index arrays.
+
+        Returns:
+            Number of unions that merged two sets
+        """
+        merged = 0
+        for x, y in zip(xs, ys):
+            if self.union(int(x), int(y)):
+                merged += 1
+        return merged
+
+    def connected(self, x: int, y: int) -> bool:
+        """Check whether x and y are in the same set."""
+        return self.find(x) == self.find(y)
+
+    def size(self, x: int) -> int:
+        """Size of the set containing x."""
+        return self.sizes[self.find(x)]
+
+    def largest_k(self, k: int) -> List[int]:
+        """Sizes of the k largest sets, in descending order."""
+        return nlargest(k, (self.sizes[root] for root in self.roots))
+
+    def get_component_sizes(self) -> List[int]:
+        """Get the sizes of all sets."""
+        return [self.sizes[root] for root in self.roots]
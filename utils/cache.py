@@ -0,0 +1,234 @@
+"""On-disk cache helpers for Advent of Code solutions."""
+
+import ast
+import pickle
+import struct
+import hashlib
+import shelve
+from collections import OrderedDict
+from pathlib import Path
+
+# Default location for cached artifacts (not tracked in git)
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+
+# The utils package, whose modules count as dependencies of a solution
+UTILS_DIR = Path(__file__).parent
+
+
+def input_digest(data: str) -> str:
+    """Hash puzzle input text so cached artifacts can be keyed by it.
+
+    Args:
+        data: The raw input text
+
+    Returns:
+        Hex SHA-256 digest of the text
+    """
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _utils_imports(tree, in_utils: bool):
+    """Yield the utils module names (e.g. 'utils.cache') imported in a parsed module."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ''
+            if node.level > 0:
+                if not in_utils:
+                    continue
+                module = f"utils.{module}" if module else "utils"
+            yield module
+            # `from utils import cache` imports a submodule
+            for alias in node.names:
+                yield f"{module}.{alias.name}"
+
+
+def source_dependencies(path) -> list:
+    """Find a module's source file plus every utils module it imports, transitively.
+
+    Imports are read from the AST, so nothing is executed.
+
+    Args:
+        path: Path to a Python source file
+
+    Returns:
+        Sorted list of Paths, including path itself
+    """
+    seen = set()
+    pending = [Path(path).resolve()]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+
+        tree = ast.parse(current.read_text(), filename=str(current))
+        in_utils = current.parent == UTILS_DIR.resolve()
+        for name in _utils_imports(tree, in_utils):
+            parts = name.split('.')
+            if parts[0] != 'utils':
+                continue
+            pending.append(UTILS_DIR.resolve() / "__init__.py")
+            if len(parts) == 2 and (UTILS_DIR / f"{parts[1]}.py").exists():
+                pending.append((UTILS_DIR / f"{parts[1]}.py").resolve())
+
+    return sorted(seen)
+
+
+def sources_digest(paths) -> str:
+    """Hash the contents of several source files into one hex SHA-256 digest."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(p) for p in paths):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_file(cache_dir, name: str) -> Path:
+    """Return the path for a cache entry, creating the directory if needed.
+
+    Args:
+        cache_dir: Cache directory (str or Path)
+        name: File name of the entry
+
+    Returns:
+        Path to the cache entry
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / name
+
+
+# Parsed-input files: magic, pickle length, buffer count, then buffer lengths
+PARSED_MAGIC = b"AOCPKL5\0"
+PARSED_HEADER = struct.Struct('<8sQQ')
+PARSED_LENGTH = struct.Struct('<Q')
+
+
+def dump_parsed(obj, path):
+    """Serialize a parsed input with pickle protocol 5 and out-of-band buffers.
+
+    Large contiguous buffers (NumPy arrays, bytearrays) are written raw after
+    the pickle stream instead of being copied into it, so load_parsed can hand
+    them back without another copy.
+
+    Args:
+        obj: Parsed input structure
+        path: Output file
+    """
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raw = [buffer.raw() for buffer in buffers]
+
+    with open(path, 'wb') as f:
+        f.write(PARSED_HEADER.pack(PARSED_MAGIC, len(payload), len(raw)))
+        for view in raw:
+            f.write(PARSED_LENGTH.pack(view.nbytes))
+        f.write(payload)
+        for view in raw:
+            f.write(view)
+
+
+def load_parsed(path):
+    """Read a parsed input written by dump_parsed.
+
+    The file is read once into a writable buffer; out-of-band buffers are
+    slices of it, so arrays come back writable without further copies.
+    """
+    path = Path(path)
+    data = bytearray(path.stat().st_size)
+    with open(path, 'rb') as f:
+        f.readinto(data)
+    view = memoryview(data)
+
+    magic, payload_size, count = PARSED_HEADER.unpack_from(view)
+    if magic != PARSED_MAGIC:
+        raise ValueError(f"{path} is not a parsed-input file")
+
+    offset = PARSED_HEADER.size
+    sizes = []
+    for _ in range(count):
+        sizes.append(PARSED_LENGTH.unpack_from(view, offset)[0])
+        offset += PARSED_LENGTH.size
+
+    payload = view[offset:offset + payload_size]
+    offset += payload_size
+    buffers = []
+    for size in sizes:
+        buffers.append(view[offset:offset + size])
+        offset += size
+
+    return pickle.loads(payload, buffers=buffers)
+
+
+class LRUCache:
+    """Bounded in-memory LRU map with an optional persistent on-disk store.
+
+    Keys may be any value with a stable repr (e.g. nested tuples of ints).
+    Lookups that miss in memory fall back to the on-disk shelf, if one is
+    configured, and writes go to both.
+    """
+
+    def __init__(self, maxsize: int = 4096, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._shelf = None
+
+    @staticmethod
+    def _disk_key(key) -> str:
+        return hashlib.sha1(repr(key).encode()).hexdigest()
+
+    def _disk(self):
+        if self._shelf is None and self.path is not None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._shelf = shelve.open(str(self.path))
+        return self._shelf
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, key) -> bool:
+        if key in self._entries:
+            return True
+        disk = self._disk()
+        return disk is not None and self._disk_key(key) in disk
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        disk = self._disk()
+        if disk is not None:
+            disk_key = self._disk_key(key)
+            if disk_key in disk:
+                value = disk[disk_key]
+                self._remember(key, value)
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """Store value under key in memory and, if configured, on disk."""
+        self._remember(key, value)
+        disk = self._disk()
+        if disk is not None:
+            disk[self._disk_key(key)] = value
+
+    def close(self):
+        """Flush and close the on-disk store."""
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
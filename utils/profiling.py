@@ -0,0 +1,132 @@
+"""CPU and memory profiling hooks for solution phases."""
+
+import io
+import argparse
+import cProfile
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+# Where .prof files are written (not tracked in git)
+PROFILE_DIR = Path(__file__).parent.parent / "profiles"
+
+# Number of functions / allocation sites listed per phase
+DEFAULT_TOP = 15
+
+
+def add_profiling_arguments(parser):
+    """Add --profile, --memory and --top options to an argument parser."""
+    parser.add_argument('--profile', action='store_true',
+                        help='profile each phase with cProfile and save .prof files')
+    parser.add_argument('--memory', action='store_true',
+                        help='trace peak memory and top allocation sites of each phase')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, metavar='N',
+                        help=f'functions / allocation sites to list (default: {DEFAULT_TOP})')
+    return parser
+
+
+def format_bytes(size):
+    """Format a byte count with a binary unit, e.g. '3.2 MiB'."""
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != 'B' else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class PhaseProfiler:
+    """Profile named phases of a solution with cProfile and/or tracemalloc.
+
+    Wrap each phase in ``with profiler.phase('part1'):``. With ``profile`` set,
+    the phase's cProfile stats are saved to ``<out_dir>/<label>_<phase>.prof``
+    and the top functions by cumulative time are kept for the report. With
+    ``memory`` set, tracemalloc records the phase's peak traced memory (in
+    ``peaks``) and the allocation sites still holding the most memory at its
+    end. A profiler with neither option does nothing.
+    """
+
+    def __init__(self, label, profile=False, memory=False, top=DEFAULT_TOP, out_dir=PROFILE_DIR):
+        self.label = label
+        self.profile = profile
+        self.memory = memory
+        self.top = top
+        self.out_dir = Path(out_dir)
+        self.peaks = {}
+        self.sections = []
+
+    @classmethod
+    def from_args(cls, label, args):
+        """Build a profiler from options added by add_profiling_arguments."""
+        return cls(label, profile=args.profile, memory=args.memory, top=args.top)
+
+    @classmethod
+    def from_command_line(cls, label, argv=None):
+        """Build a profiler from the command line of a day's script."""
+        parser = argparse.ArgumentParser(description=f"Advent of Code 2025 - {label}")
+        return cls.from_args(label, add_profiling_arguments(parser).parse_args(argv))
+
+    @property
+    def enabled(self):
+        return self.profile or self.memory
+
+    @contextmanager
+    def phase(self, name):
+        """Profile the enclosed block as the phase called name."""
+        if not self.enabled:
+            yield
+            return
+
+        profiler = None
+        if self.memory:
+            tracemalloc.start()
+        if self.profile:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._record_profile(name, profiler)
+            if self.memory:
+                self._record_memory(name)
+                tracemalloc.stop()
+
+    def _record_profile(self, name, profiler):
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        path = self.out_dir / f"{self.label}_{name}.prof"
+        profiler.dump_stats(path)
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.strip_dirs().sort_stats('cumulative').print_stats(self.top)
+        header = f"[{self.label} {name}] cProfile (saved to {path})"
+        self.sections.append(f"{header}\n{stream.getvalue().strip()}")
+
+    def _record_memory(self, name):
+        _, peak = tracemalloc.get_traced_memory()
+        self.peaks[name] = peak
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        lines = [f"[{self.label} {name}] peak {format_bytes(peak)}, "
+                 "top allocation sites still live at its end:"]
+        for stat in snapshot.statistics('lineno')[:self.top]:
+            frame = stat.traceback[0]
+            lines.append(f"  {format_bytes(stat.size):>10}  {stat.count:>8} blocks  "
+                         f"{frame.filename}:{frame.lineno}")
+        self.sections.append("\n".join(lines))
+
+    def report(self):
+        """Return the collected profiles as text."""
+        return "\n\n".join(self.sections)
+
+    def print_report(self):
+        """Print the collected profiles, if profiling was enabled."""
+        if self.enabled:
+            print()
+            print(self.report())